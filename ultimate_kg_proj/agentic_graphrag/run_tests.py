@@ -6,20 +6,21 @@ This script provides convenient commands for running different types of tests
 and validation procedures for the Agentic GraphRAG system.
 """
 
+import os
 import sys
 import subprocess
 import argparse
 import asyncio
 from pathlib import Path
 
-def run_command(cmd, description):
+def run_command(cmd, description, env=None):
     """Run a command and report results"""
     print(f"\n{'='*60}")
     print(f"Running: {description}")
     print(f"Command: {' '.join(cmd)}")
     print(f"{'='*60}")
     
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = subprocess.run(cmd, capture_output=True, text=True, env=env)
     
     print(result.stdout)
     if result.stderr:
@@ -32,6 +33,10 @@ def run_command(cmd, description):
     
     return result.returncode == 0
 
+def xdist_workers():
+    """Number of pytest-xdist workers, leaving two cores free for the runner"""
+    return str(max(1, (os.cpu_count() or 1) - 2))
+
 def run_unit_tests():
     """Run unit tests for individual components"""
     cmd = [
@@ -39,6 +44,8 @@ def run_unit_tests():
         "tests/test_a2a_server.py",
         "tests/test_kg_agent.py",
         "-m", "not integration and not slow",
+        "-n", xdist_workers(),
+        "--dist", "loadgroup",
         "--tb=short"
     ]
     return run_command(cmd, "Unit Tests")
@@ -48,10 +55,12 @@ def run_integration_tests():
     cmd = [
         "python", "-m", "pytest",
         "tests/test_integration.py",
+        "tests/test_kg_agent.py",
         "-m", "integration",
         "--tb=short"
     ]
-    return run_command(cmd, "Integration Tests")
+    env = {**os.environ, "RUN_INTEGRATION": "1"}
+    return run_command(cmd, "Integration Tests", env=env)
 
 def run_all_tests():
     """Run all tests"""
@@ -59,6 +68,8 @@ def run_all_tests():
         "python", "-m", "pytest",
         "tests/",
         "-m", "not slow and not real",
+        "-n", xdist_workers(),
+        "--dist", "loadgroup",
         "--tb=short"
     ]
     return run_command(cmd, "All Tests (excluding slow/real)")
@@ -34,16 +34,28 @@ setup(
         "dev": [
             "pytest>=8.0.0",
             "pytest-asyncio>=0.24.0",
+            "pytest-xdist>=3.5.0",
+            "pytest-subtests>=0.13.0",
             "black>=24.0.0",
             "ruff>=0.6.0",
             "mypy>=1.11.0",
         ],
+        "aiohttp": [
+            "httpx-aiohttp>=0.1.8",
+        ],
+        "orjson": [
+            "orjson>=3.10.0",
+        ],
         "all": [
             "pytest>=8.0.0",
             "pytest-asyncio>=0.24.0", 
+            "pytest-xdist>=3.5.0",
+            "pytest-subtests>=0.13.0",
             "black>=24.0.0",
             "ruff>=0.6.0",
             "mypy>=1.11.0",
+            "httpx-aiohttp>=0.1.8",
+            "orjson>=3.10.0",
         ],
     },
     entry_points={
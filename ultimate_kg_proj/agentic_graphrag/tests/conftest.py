@@ -0,0 +1,77 @@
+"""
+Shared pytest fixtures for the Agentic GraphRAG test suite.
+
+The initialized KG agent is built once per session and its mutable state
+is reset before each test that uses it. All async tests share a single
+session-scoped event loop.
+"""
+
+import pytest
+import pytest_asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock, AsyncMock, patch
+
+from agentic_graphrag.agents.kg_agent import KnowledgeGraphAgent
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on the shared session event loop and report its markers"""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+        # Lets validate_system.py bucket a single JUnit XML run by marker
+        item.user_properties.append(("markers", ",".join(m.name for m in item.iter_markers())))
+
+@pytest.fixture(scope="session")
+def uninitialized_kg_agent():
+    """Create a bare KG agent, shared by tests that never initialize it"""
+    return KnowledgeGraphAgent()
+
+@pytest.fixture(scope="session")
+def mocks():
+    """Create the mock ADK and MCP collaborators behind the shared KG agent"""
+    ns = SimpleNamespace(
+        mcp_toolset=Mock(close=AsyncMock()),
+        llm_agent=Mock(),
+        runner=Mock(run_async=Mock()),
+        session_service=Mock(create_session=AsyncMock()),
+        session=Mock(id="test-session-123", user_id="system"),
+    )
+    ns.session_service.create_session.return_value = ns.session
+    return ns
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def initialized_kg_agent(mocks):
+    """Create an initialized KG agent with mocks, shared across the session"""
+    # The agent keeps its references after initialize(), so the patches are
+    # only needed while it runs and must not leak into later tests
+    with patch.multiple(
+        'agentic_graphrag.agents.kg_agent',
+        MCPToolset=Mock(return_value=mocks.mcp_toolset),
+        LlmAgent=Mock(return_value=mocks.llm_agent),
+        InMemorySessionService=Mock(return_value=mocks.session_service),
+        Runner=Mock(return_value=mocks.runner)
+    ):
+        kg_agent = KnowledgeGraphAgent()
+        await kg_agent.initialize()
+
+    yield kg_agent
+
+@pytest.fixture(autouse=True)
+def _reset_kg_agent(request):
+    """Reset the shared KG agent's mutable state before each test that uses it"""
+    if "initialized_kg_agent" not in request.fixturenames:
+        return
+
+    kg_agent = request.getfixturevalue("initialized_kg_agent")
+    kg_agent.initialized = True
+    kg_agent.toolset.close = AsyncMock()
+    kg_agent.runner.run_async = Mock()
+    kg_agent.runner.run_async.side_effect = None
+    kg_agent.processing_stats = {
+        "requests_processed": 0,
+        "data_items_processed": 0,
+        "searches_performed": 0,
+        "connections_detected": 0,
+        "last_activity": None
+    }
@@ -16,37 +16,183 @@ Usage:
 """
 
 import asyncio
+import functools
+import hashlib
+import os
+import re
 import sys
 import json
-import subprocess
 import time
+import xml.etree.ElementTree as ET
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 import httpx
 import logging
 
+try:
+    import aiohttp
+    from httpx_aiohttp import AiohttpTransport
+except ImportError:  # optional: pip install agentic-graphrag-a2a[aiohttp]
+    AiohttpTransport = None
+
+try:
+    import orjson
+except ImportError:  # optional: pip install agentic-graphrag-a2a[orjson]
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Source tree scanned in-process by the code-pattern validators
+SOURCE_ROOT = Path("agentic_graphrag")
+
+REQUIRED_DOCS = ("README.md", "DEPLOYMENT.md", "requirements.txt", "setup.py")
+CONFIG_FILES = (".env.example", "docker-compose.yml", "agentic_graphrag/config/__init__.py")
+A2A_UTILS_FILE = "agentic_graphrag/server/a2a_utils.py"
+
+# Single pytest run shared by the end-to-end, error handling and performance checks;
+# -k also matches marker names, so this selects the union of all three
+PYTEST_JUNIT_XML = Path(".validate_pytest.xml")
+PYTEST_SELECTION = "error or integration or performance"
+
+# On-disk cache of passing deterministic checks, reused by repeated runs within the TTL
+CACHE_PATH = Path(".validate_cache.json")
+CACHE_TTL = 30
+
+# Ingest payloads for the fact extraction format check, serialized once at import
+_CAROL_JSON = json.dumps({"name": "Carol", "role": "Product Manager", "company": "StartupInc"})
+_FORMAT_SAMPLES = (
+    ("text", "Bob is a data scientist at TechCorp"),
+    ("json", _CAROL_JSON),
+)
+
+# Report category keywords, most specific category first: "comprehensive error
+# handling" must land in production readiness rather than core "error handling"
+CATEGORY_KEYWORDS = {
+    "production_readiness": ("comprehensive error", "logging", "performance", "security",
+                             "documentation", "configuration management"),
+    "integration_quality": ("mcp toolset", "adk agent", "a2a protocol", "multi-database",
+                            "environment config", "a2a server validation"),
+    "core_functionality": ("a2a server request", "kg agent mcp", "fact extraction", "connection detection",
+                           "notification", "concurrent", "error handling", "end-to-end"),
+}
+REPORT_CATEGORIES = ("core_functionality", "integration_quality", "production_readiness")
+
 class ValidationResult:
     """Container for validation results"""
     
     def __init__(self, name: str, success: bool, details: str = "", metadata: Dict = None):
         self.name = name
+        self.name_lower = name.lower()
         self.success = success
         self.details = details
         self.metadata = metadata or {}
         self.timestamp = datetime.now()
 
+def cached(ttl: float = CACHE_TTL, inputs: Tuple[str, ...] = ()):
+    """Serve a validator's passing result from the on-disk cache while it is fresh and its inputs are unchanged"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self) -> bool:
+            if not self.use_cache:
+                return await func(self)
+            
+            digest = self._inputs_hash(inputs)
+            entry = self._cache.get(func.__name__)
+            if entry is not None and entry[1] == digest and time.time() - entry[0] < ttl:
+                return entry[2]
+            
+            success = await func(self)
+            # Only passing results are cached, so a fixed failure is re-checked on the next run
+            if success is True:
+                self._cache[func.__name__] = (time.time(), digest, success)
+                self._cache_dirty = True
+            return success
+        return wrapper
+    return decorator
+
+
 class SystemValidator:
     """Comprehensive system validator for Agentic GraphRAG"""
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         self.results: List[ValidationResult] = []
         self.server_url = "http://localhost:8080"
+        self._url_ingest = f"{self.server_url}/agents/kg_ingest"
+        self._url_status = f"{self.server_url}/agents/kg_status"
         self.test_timeout = 30
+        self.concurrency_probe_count = 5
+        self._concurrency_probe_limit = 5
+        self._client: Optional[httpx.AsyncClient] = None
+        self._aiohttp_session = None
+        self._path_cache: Dict[Path, Tuple[float, str]] = {}
+        self._tree_scans: Dict[Path, asyncio.Task] = {}
+        self._existing_paths: Optional[frozenset] = None
+        self._pytest_run: Optional[asyncio.Task] = None
+        self._print_buf: List[str] = []
+        self.use_cache = use_cache
+        self._cache_path = CACHE_PATH
+        self._cache: Dict[str, Tuple[float, str, bool]] = {}
+        self._cache_dirty = False
+    
+    async def __aenter__(self):
+        """Open the HTTP client shared by all server validations"""
+        # aiohttp's transport keeps tail latency down under concurrent probes; use it when installed.
+        # httpx only applies limits to its own transport, so the aiohttp pool is capped on its connector
+        if AiohttpTransport is not None:
+            self._aiohttp_session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=64))
+            self._client = httpx.AsyncClient(
+                timeout=self.test_timeout,
+                transport=AiohttpTransport(client=self._aiohttp_session)
+            )
+        else:
+            self._client = httpx.AsyncClient(
+                timeout=self.test_timeout,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+            )
+        if self.use_cache:
+            self._load_cache()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the shared HTTP client and persist newly cached results"""
+        await self._client.aclose()
+        self._client = None
+        if self._aiohttp_session is not None:
+            await self._aiohttp_session.close()
+            self._aiohttp_session = None
+        if self._cache_dirty:
+            self._save_cache()
+    
+    def _load_cache(self):
+        """Load the on-disk result cache, ignoring a missing or unreadable file"""
+        try:
+            raw = json.loads(self._cache_path.read_text())
+            self._cache = {name: tuple(entry) for name, entry in raw.items()}
+        except (OSError, ValueError, TypeError, AttributeError):
+            self._cache = {}
+    
+    def _save_cache(self):
+        """Write unexpired cache entries back to disk"""
+        now = time.time()
+        fresh = {name: entry for name, entry in self._cache.items() if now - entry[0] < CACHE_TTL}
+        try:
+            self._cache_path.write_text(json.dumps(fresh))
+        except OSError as e:
+            logger.error(f"Could not write validation cache: {e}")
+        self._cache_dirty = False
+    
+    @staticmethod
+    def _inputs_hash(paths: Tuple[str, ...]) -> str:
+        """Fingerprint the content of a validator's input files"""
+        digest = hashlib.md5()
+        for path in paths:
+            file = Path(path)
+            digest.update(path.encode())
+            digest.update(file.read_bytes() if file.is_file() else b"<missing>")
+        return digest.hexdigest()
         
     def add_result(self, name: str, success: bool, details: str = "", metadata: Dict = None):
         """Add a validation result"""
@@ -54,83 +200,61 @@ class SystemValidator:
         self.results.append(result)
         
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status} {name}: {details}")
+        self._print_buf.append(f"{status} {name}: {details}")
         
         return success
     
+    def flush_prints(self):
+        """Write buffered result lines to stdout in a single call"""
+        if not self._print_buf:
+            return
+        sys.stdout.write("\n".join(self._print_buf))
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+        self._print_buf.clear()
+    
     async def validate_core_functionality(self) -> List[ValidationResult]:
         """Validate core functionality requirements"""
         print("\n" + "="*80)
         print("🔧 CORE FUNCTIONALITY VALIDATION")
         print("="*80)
         
-        core_results = []
-        
-        # 1. A2A server accepts and processes external requests
-        success = await self._validate_a2a_server_requests()
-        core_results.append(self.add_result(
-            "A2A Server Request Processing",
-            success,
-            "A2A server accepts and processes external requests" if success else "A2A server request processing failed"
-        ))
-        
-        # 2. KG Agent interfaces with Cognee MCP tools
-        success = await self._validate_kg_agent_mcp_integration()
-        core_results.append(self.add_result(
-            "KG Agent MCP Integration",
-            success,
-            "KG Agent successfully interfaces with Cognee MCP tools" if success else "KG Agent MCP integration failed"
-        ))
-        
-        # 3. Fact extraction handles multiple data formats
-        success = await self._validate_fact_extraction_formats()
-        core_results.append(self.add_result(
-            "Multi-Format Fact Extraction",
-            success,
-            "Fact extraction handles multiple data formats" if success else "Fact extraction format handling failed"
-        ))
-        
-        # 4. Connection detection identifies relationships
-        success = await self._validate_connection_detection()
-        core_results.append(self.add_result(
-            "Connection Detection",
-            success,
-            "Connection detection identifies relationships automatically" if success else "Connection detection failed"
-        ))
-        
-        # 5. Notifications trigger when threshold exceeded
-        success = await self._validate_notification_system()
-        core_results.append(self.add_result(
-            "Notification System",
-            success,
-            "Notifications trigger when relevance threshold exceeded" if success else "Notification system failed"
-        ))
-        
-        # 6. System handles concurrent requests
-        success = await self._validate_concurrent_requests()
-        core_results.append(self.add_result(
-            "Concurrent Request Handling",
-            success,
-            "System handles concurrent requests efficiently" if success else "Concurrent request handling failed"
-        ))
-        
-        # 7. Comprehensive error handling
-        success = await self._validate_error_handling()
-        core_results.append(self.add_result(
-            "Error Handling",
-            success,
-            "All components include comprehensive error handling" if success else "Error handling validation failed"
-        ))
-        
-        # 8. End-to-end workflow validation
-        success = await self._validate_end_to_end_workflows()
-        core_results.append(self.add_result(
-            "End-to-End Workflows",
-            success,
-            "Integration tests validate end-to-end workflows" if success else "End-to-end validation failed"
-        ))
-        
-        return core_results
+        checks = [
+            # 1. A2A server accepts and processes external requests
+            ("A2A Server Request Processing", self._validate_a2a_server_requests,
+             "A2A server accepts and processes external requests",
+             "A2A server request processing failed"),
+            # 2. KG Agent interfaces with Cognee MCP tools
+            ("KG Agent MCP Integration", self._validate_kg_agent_mcp_integration,
+             "KG Agent successfully interfaces with Cognee MCP tools",
+             "KG Agent MCP integration failed"),
+            # 3. Fact extraction handles multiple data formats
+            ("Multi-Format Fact Extraction", self._validate_fact_extraction_formats,
+             "Fact extraction handles multiple data formats",
+             "Fact extraction format handling failed"),
+            # 4. Connection detection identifies relationships
+            ("Connection Detection", self._validate_connection_detection,
+             "Connection detection identifies relationships automatically",
+             "Connection detection failed"),
+            # 5. Notifications trigger when threshold exceeded
+            ("Notification System", self._validate_notification_system,
+             "Notifications trigger when relevance threshold exceeded",
+             "Notification system failed"),
+            # 6. System handles concurrent requests
+            ("Concurrent Request Handling", self._validate_concurrent_requests,
+             "System handles concurrent requests efficiently",
+             "Concurrent request handling failed"),
+            # 7. Comprehensive error handling
+            ("Error Handling", self._validate_error_handling,
+             "All components include comprehensive error handling",
+             "Error handling validation failed"),
+            # 8. End-to-end workflow validation
+            ("End-to-End Workflows", self._validate_end_to_end_workflows,
+             "Integration tests validate end-to-end workflows",
+             "End-to-end validation failed"),
+        ]
+        
+        return await self._run_checks(checks)
     
     async def validate_integration_quality(self) -> List[ValidationResult]:
         """Validate integration quality requirements"""
@@ -138,57 +262,34 @@ class SystemValidator:
         print("🔗 INTEGRATION QUALITY VALIDATION")
         print("="*80)
         
-        integration_results = []
-        
-        # 1. MCP toolset integration
-        success = await self._validate_mcp_toolset_integration()
-        integration_results.append(self.add_result(
-            "MCP Toolset Integration",
-            success,
-            "MCP toolset properly integrated" if success else "MCP toolset integration failed"
-        ))
-        
-        # 2. ADK agent coordination
-        success = await self._validate_adk_agent_coordination()
-        integration_results.append(self.add_result(
-            "ADK Agent Coordination",
-            success,
-            "ADK agent coordination working" if success else "ADK agent coordination failed"
-        ))
-        
-        # 3. A2A protocol compliance
-        success = await self._validate_a2a_protocol_compliance()
-        integration_results.append(self.add_result(
-            "A2A Protocol Compliance",
-            success,
-            "A2A protocol compliance validated" if success else "A2A protocol compliance failed"
-        ))
-        
-        # 4. Multi-database operations
-        success = await self._validate_multi_database_operations()
-        integration_results.append(self.add_result(
-            "Multi-Database Operations",
-            success,
-            "Neo4j, LanceDB, SQLite operations verified" if success else "Multi-database operations failed"
-        ))
-        
-        # 5. Environment configuration
-        success = await self._validate_environment_configuration()
-        integration_results.append(self.add_result(
-            "Environment Configuration",
-            success,
-            "Configuration management working" if success else "Environment configuration failed"
-        ))
-        
-        # 6. A2A server validation
-        success = await self._validate_a2a_server_validation()
-        integration_results.append(self.add_result(
-            "A2A Server Validation",
-            success,
-            "A2A server validation successful" if success else "A2A server validation failed"
-        ))
-        
-        return integration_results
+        checks = [
+            # 1. MCP toolset integration
+            ("MCP Toolset Integration", self._validate_mcp_toolset_integration,
+             "MCP toolset properly integrated",
+             "MCP toolset integration failed"),
+            # 2. ADK agent coordination
+            ("ADK Agent Coordination", self._validate_adk_agent_coordination,
+             "ADK agent coordination working",
+             "ADK agent coordination failed"),
+            # 3. A2A protocol compliance
+            ("A2A Protocol Compliance", self._validate_a2a_protocol_compliance,
+             "A2A protocol compliance validated",
+             "A2A protocol compliance failed"),
+            # 4. Multi-database operations
+            ("Multi-Database Operations", self._validate_multi_database_operations,
+             "Neo4j, LanceDB, SQLite operations verified",
+             "Multi-database operations failed"),
+            # 5. Environment configuration
+            ("Environment Configuration", self._validate_environment_configuration,
+             "Configuration management working",
+             "Environment configuration failed"),
+            # 6. A2A server validation
+            ("A2A Server Validation", self._validate_a2a_server_validation,
+             "A2A server validation successful",
+             "A2A server validation failed"),
+        ]
+        
+        return await self._run_checks(checks)
     
     async def validate_production_readiness(self) -> List[ValidationResult]:
         """Validate production readiness requirements"""
@@ -196,85 +297,187 @@ class SystemValidator:
         print("🏭 PRODUCTION READINESS VALIDATION")
         print("="*80)
         
-        production_results = []
-        
-        # 1. Comprehensive error handling
-        success = await self._validate_comprehensive_error_handling()
-        production_results.append(self.add_result(
-            "Comprehensive Error Handling",
-            success,
-            "Error handling covers all failure scenarios" if success else "Error handling insufficient"
-        ))
-        
-        # 2. Logging and monitoring
-        success = await self._validate_logging_and_monitoring()
-        production_results.append(self.add_result(
-            "Logging and Monitoring",
-            success,
-            "Logging and monitoring systems working" if success else "Logging/monitoring failed"
-        ))
-        
-        # 3. Performance under load
-        success = await self._validate_performance_under_load()
-        production_results.append(self.add_result(
-            "Performance Under Load",
-            success,
-            "Performance acceptable under load" if success else "Performance under load failed"
-        ))
-        
-        # 4. Security measures
-        success = await self._validate_security_measures()
-        production_results.append(self.add_result(
-            "Security Measures",
-            success,
-            "Security measures implemented" if success else "Security validation failed"
-        ))
-        
-        # 5. Documentation complete
-        success = await self._validate_documentation_completeness()
-        production_results.append(self.add_result(
-            "Documentation Completeness",
-            success,
-            "Documentation is complete" if success else "Documentation incomplete"
-        ))
-        
-        # 6. Configuration management
-        success = await self._validate_configuration_management()
-        production_results.append(self.add_result(
-            "Configuration Management",
-            success,
-            "Configuration management working" if success else "Configuration management failed"
-        ))
+        checks = [
+            # 1. Comprehensive error handling
+            ("Comprehensive Error Handling", self._validate_comprehensive_error_handling,
+             "Error handling covers all failure scenarios",
+             "Error handling insufficient"),
+            # 2. Logging and monitoring
+            ("Logging and Monitoring", self._validate_logging_and_monitoring,
+             "Logging and monitoring systems working",
+             "Logging/monitoring failed"),
+            # 3. Performance under load
+            ("Performance Under Load", self._validate_performance_under_load,
+             "Performance acceptable under load",
+             "Performance under load failed"),
+            # 4. Security measures
+            ("Security Measures", self._validate_security_measures,
+             "Security measures implemented",
+             "Security validation failed"),
+            # 5. Documentation complete
+            ("Documentation Completeness", self._validate_documentation_completeness,
+             "Documentation is complete",
+             "Documentation incomplete"),
+            # 6. Configuration management
+            ("Configuration Management", self._validate_configuration_management,
+             "Configuration management working",
+             "Configuration management failed"),
+        ]
+        
+        return await self._run_checks(checks)
+    
+    async def _run_checks(self, checks: List[Tuple]) -> List[bool]:
+        """Run independent validation checks concurrently and record results in order"""
+        outcomes = await asyncio.gather(*(check() for _, check, _, _ in checks), return_exceptions=True)
+        
+        results = []
+        for (name, _, success_details, failure_details), outcome in zip(checks, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"{name} validation raised: {outcome}")
+            success = outcome is True
+            results.append(self.add_result(name, success, success_details if success else failure_details))
+        
+        return results
+    
+    async def _run(self, argv: List[str], timeout: Optional[float] = None) -> Tuple[int, str, str]:
+        """Run a command without blocking the event loop, returning (returncode, stdout, stderr)"""
+        proc = await asyncio.create_subprocess_exec(
+            *argv, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            logger.error(f"Command timed out after {timeout}s: {' '.join(argv)}")
+            return -1, "", f"Timed out after {timeout}s"
+        
+        return proc.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+    
+    async def _pytest_tests(self, predicate) -> Optional[List[Dict[str, Any]]]:
+        """Return the shared pytest run's test cases matching predicate, or None if the run broke"""
+        if self._pytest_run is None:
+            self._pytest_run = asyncio.create_task(self._run_pytest_once())
+        tests = await self._pytest_run
+        if tests is None:
+            return None
+        return [t for t in tests if predicate(t)]
+    
+    async def _run_pytest_once(self) -> Optional[List[Dict[str, Any]]]:
+        """Run the selected tests in one pytest process and parse its JUnit XML report"""
+        returncode, _, stderr = await self._run([
+            "python", "-m", "pytest", "tests/",
+            "-k", PYTEST_SELECTION, "--tb=short", "-q",
+            f"--junitxml={PYTEST_JUNIT_XML}"
+        ], 180)
         
-        return production_results
+        try:
+            # 0 = passed, 1 = some tests failed, 5 = nothing selected; anything else is a broken run
+            if returncode not in (0, 1, 5):
+                logger.error(f"Shared pytest run failed with exit code {returncode}: {stderr.strip()}")
+                return None
+            if not PYTEST_JUNIT_XML.exists():
+                return []
+            
+            return await asyncio.to_thread(self._parse_junit, PYTEST_JUNIT_XML)
+        finally:
+            PYTEST_JUNIT_XML.unlink(missing_ok=True)
+    
+    @staticmethod
+    def _parse_junit(path: Path) -> List[Dict[str, Any]]:
+        """Flatten a JUnit XML report into test case dicts with outcome and markers"""
+        tests = []
+        for _, elem in ET.iterparse(path):
+            if elem.tag != "testcase":
+                continue
+            classname = elem.get("classname", "")
+            name = elem.get("name", "")
+            markers = set()
+            for prop in elem.iter("property"):
+                if prop.get("name") == "markers":
+                    markers.update(filter(None, prop.get("value", "").split(",")))
+            if elem.find("failure") is not None or elem.find("error") is not None:
+                outcome = "failed"
+            elif elem.find("skipped") is not None:
+                outcome = "skipped"
+            else:
+                outcome = "passed"
+            tests.append({
+                "classname": classname,
+                "nodeid": f"{classname}.{name}".lower(),
+                "markers": markers,
+                "outcome": outcome
+            })
+            elem.clear()
+        return tests
+    
+    def _read(self, path: str) -> str:
+        """Read a text file, reusing the cached content while its mtime is unchanged"""
+        resolved = Path(path).resolve()
+        mtime = resolved.stat().st_mtime
+        cached = self._path_cache.get(resolved)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        content = resolved.read_text()
+        self._path_cache[resolved] = (mtime, content)
+        return content
+    
+    async def _scan_tree(self, root: Path = SOURCE_ROOT) -> str:
+        """Return the concatenated contents of every file under root, walking it once per session"""
+        if root not in self._tree_scans:
+            self._tree_scans[root] = asyncio.create_task(asyncio.to_thread(self._read_tree, root))
+        return await self._tree_scans[root]
+    
+    @staticmethod
+    def _read_tree(root: Path) -> str:
+        """Walk root with os.scandir and join the text of all regular files"""
+        chunks = []
+        pending = [str(root)]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        with open(entry.path, "r", encoding="utf-8", errors="ignore") as f:
+                            chunks.append(f.read())
+        return "\n".join(chunks)
+    
+    def _exists(self, path: str) -> bool:
+        """Check a documentation/config path against one shared existence batch"""
+        if self._existing_paths is None:
+            candidates = set(REQUIRED_DOCS) | set(CONFIG_FILES) | {A2A_UTILS_FILE}
+            self._existing_paths = frozenset(p for p in candidates if Path(p).exists())
+        return path in self._existing_paths
     
     # Core Functionality Validation Methods
     
     async def _validate_a2a_server_requests(self) -> bool:
         """Validate A2A server accepts and processes requests"""
         try:
-            async with httpx.AsyncClient(timeout=self.test_timeout) as client:
-                # Test status endpoint
-                response = await client.post(
-                    f"{self.server_url}/agents/kg_status",
-                    json={"detailed": False}
-                )
-                
-                if response.status_code != 200:
-                    return False
-                
-                # Test ingestion endpoint with sample data
-                response = await client.post(
-                    f"{self.server_url}/agents/kg_ingest",
-                    json={
-                        "data": "Test validation: Alice is a software engineer",
-                        "format": "text",
-                        "options": {"extract_facts": True, "detect_connections": False}
-                    }
-                )
-                
-                return response.status_code == 200
-                
+            client = self._client
+            # Test status endpoint
+            response = await client.post(
+                self._url_status,
+                json={"detailed": False}
+            )
+            
+            if response.status_code != 200:
+                return False
+            
+            # Test ingestion endpoint with sample data
+            response = await client.post(
+                self._url_ingest,
+                json={
+                    "data": "Test validation: Alice is a software engineer",
+                    "format": "text",
+                    "options": {"extract_facts": True, "detect_connections": False}
+                }
+            )
+            
+            return response.status_code == 200
+            
         except Exception as e:
             logger.error(f"A2A server validation failed: {e}")
             return False
@@ -283,15 +486,15 @@ class SystemValidator:
         """Validate KG Agent MCP integration"""
         try:
             # Test system self-validation
-            result = subprocess.run([
+            returncode, stdout, _ = await self._run([
                 "python", "main.py", "--test-only"
-            ], capture_output=True, text=True, timeout=60)
+            ], 60)
             
-            if result.returncode != 0:
+            if returncode != 0:
                 return False
             
             # Check for MCP integration in output
-            return "MCP" in result.stdout or "mcp" in result.stdout
+            return "MCP" in stdout or "mcp" in stdout
             
         except Exception as e:
             logger.error(f"KG Agent MCP validation failed: {e}")
@@ -300,29 +503,23 @@ class SystemValidator:
     async def _validate_fact_extraction_formats(self) -> bool:
         """Validate fact extraction handles multiple formats"""
         try:
-            async with httpx.AsyncClient(timeout=self.test_timeout) as client:
-                formats_to_test = ["text", "json"]
-                
-                for fmt in formats_to_test:
-                    test_data = {
-                        "text": "Bob is a data scientist at TechCorp",
-                        "json": json.dumps({"name": "Carol", "role": "Product Manager", "company": "StartupInc"})
+            client = self._client
+            
+            for fmt, data in _FORMAT_SAMPLES:
+                response = await client.post(
+                    self._url_ingest,
+                    json={
+                        "data": data,
+                        "format": fmt,
+                        "options": {"extract_facts": True, "detect_connections": False}
                     }
-                    
-                    response = await client.post(
-                        f"{self.server_url}/agents/kg_ingest",
-                        json={
-                            "data": test_data[fmt],
-                            "format": fmt,
-                            "options": {"extract_facts": True, "detect_connections": False}
-                        }
-                    )
-                    
-                    if response.status_code != 200:
-                        return False
-                
-                return True
+                )
                 
+                if response.status_code != 200:
+                    return False
+            
+            return True
+            
         except Exception as e:
             logger.error(f"Fact extraction format validation failed: {e}")
             return False
@@ -330,23 +527,23 @@ class SystemValidator:
     async def _validate_connection_detection(self) -> bool:
         """Validate connection detection"""
         try:
-            async with httpx.AsyncClient(timeout=self.test_timeout) as client:
-                response = await client.post(
-                    f"{self.server_url}/agents/kg_ingest",
-                    json={
-                        "data": "David works at Google. He is a software engineer.",
-                        "format": "text",
-                        "options": {"extract_facts": True, "detect_connections": True}
-                    }
-                )
-                
-                if response.status_code != 200:
-                    return False
-                
-                data = response.json()
-                # Check if connections were detected
-                return "connections_found" in data and isinstance(data.get("connections_found"), int)
-                
+            client = self._client
+            response = await client.post(
+                self._url_ingest,
+                json={
+                    "data": "David works at Google. He is a software engineer.",
+                    "format": "text",
+                    "options": {"extract_facts": True, "detect_connections": True}
+                }
+            )
+            
+            if response.status_code != 200:
+                return False
+            
+            data = response.json()
+            # Check if connections were detected
+            return "connections_found" in data and isinstance(data.get("connections_found"), int)
+            
         except Exception as e:
             logger.error(f"Connection detection validation failed: {e}")
             return False
@@ -354,27 +551,27 @@ class SystemValidator:
     async def _validate_notification_system(self) -> bool:
         """Validate notification system"""
         try:
-            async with httpx.AsyncClient(timeout=self.test_timeout) as client:
-                response = await client.post(
-                    f"{self.server_url}/agents/kg_ingest",
-                    json={
-                        "data": "Emma is the CEO of MegaCorp. She has 20 years of experience.",
-                        "format": "text",
-                        "options": {
-                            "extract_facts": True, 
-                            "detect_connections": True,
-                            "notify_threshold": 0.5  # Low threshold to trigger notifications
-                        }
+            client = self._client
+            response = await client.post(
+                self._url_ingest,
+                json={
+                    "data": "Emma is the CEO of MegaCorp. She has 20 years of experience.",
+                    "format": "text",
+                    "options": {
+                        "extract_facts": True, 
+                        "detect_connections": True,
+                        "notify_threshold": 0.5  # Low threshold to trigger notifications
                     }
-                )
-                
-                if response.status_code != 200:
-                    return False
-                
-                data = response.json()
-                # Check if notifications were processed
-                return "notifications_sent" in data and isinstance(data.get("notifications_sent"), int)
-                
+                }
+            )
+            
+            if response.status_code != 200:
+                return False
+            
+            data = response.json()
+            # Check if notifications were processed
+            return "notifications_sent" in data and isinstance(data.get("notifications_sent"), int)
+            
         except Exception as e:
             logger.error(f"Notification system validation failed: {e}")
             return False
@@ -382,26 +579,29 @@ class SystemValidator:
     async def _validate_concurrent_requests(self) -> bool:
         """Validate concurrent request handling"""
         try:
-            async with httpx.AsyncClient(timeout=self.test_timeout) as client:
-                # Send multiple concurrent requests
-                tasks = []
-                for i in range(5):
-                    task = client.post(
-                        f"{self.server_url}/agents/kg_status",
+            sem = asyncio.Semaphore(self._concurrency_probe_limit)
+            
+            async def _one():
+                async with sem:
+                    return await self._client.post(
+                        self._url_status,
                         json={"detailed": False}
                     )
-                    tasks.append(task)
-                
-                responses = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                # Check that all requests succeeded
-                successful = 0
-                for response in responses:
-                    if isinstance(response, httpx.Response) and response.status_code == 200:
-                        successful += 1
-                
-                return successful >= 4  # Allow for 1 failure
-                
+            
+            # Send concurrent requests over the shared client, bounded by the probe limit
+            responses = await asyncio.gather(
+                *[_one() for _ in range(self.concurrency_probe_count)],
+                return_exceptions=True
+            )
+            
+            # Check that all requests succeeded
+            successful = 0
+            for response in responses:
+                if isinstance(response, httpx.Response) and response.status_code == 200:
+                    successful += 1
+            
+            return successful >= self.concurrency_probe_count - 1  # Allow for 1 failure
+            
         except Exception as e:
             logger.error(f"Concurrent request validation failed: {e}")
             return False
@@ -409,16 +609,16 @@ class SystemValidator:
     async def _validate_error_handling(self) -> bool:
         """Validate error handling"""
         try:
-            async with httpx.AsyncClient(timeout=self.test_timeout) as client:
-                # Test invalid request
-                response = await client.post(
-                    f"{self.server_url}/agents/kg_ingest",
-                    json={"invalid": "request"}  # Missing required fields
-                )
-                
-                # Should return error but not crash
-                return response.status_code in [400, 500]  # Error response expected
-                
+            client = self._client
+            # Test invalid request
+            response = await client.post(
+                self._url_ingest,
+                json={"invalid": "request"}  # Missing required fields
+            )
+            
+            # Should return error but not crash
+            return response.status_code in [400, 500]  # Error response expected
+            
         except Exception as e:
             logger.error(f"Error handling validation failed: {e}")
             return False
@@ -426,13 +626,12 @@ class SystemValidator:
     async def _validate_end_to_end_workflows(self) -> bool:
         """Validate end-to-end workflows"""
         try:
-            # Run integration tests
-            result = subprocess.run([
-                "python", "-m", "pytest", "tests/test_integration.py", 
-                "-m", "integration", "--tb=short", "-q"
-            ], capture_output=True, text=True, timeout=120)
+            # Integration-marked tests from the integration suite
+            tests = await self._pytest_tests(
+                lambda t: "test_integration" in t["classname"] and "integration" in t["markers"]
+            )
             
-            return result.returncode == 0
+            return bool(tests) and all(t["outcome"] != "failed" for t in tests)
             
         except Exception as e:
             logger.error(f"End-to-end workflow validation failed: {e}")
@@ -444,11 +643,8 @@ class SystemValidator:
         """Validate MCP toolset integration"""
         try:
             # Check for MCP-related patterns in codebase
-            result = subprocess.run([
-                "grep", "-r", "MCPToolset", "agentic_graphrag/"
-            ], capture_output=True, text=True)
-            
-            return result.returncode == 0 and len(result.stdout.strip()) > 0
+            source = await self._scan_tree()
+            return "MCPToolset" in source
             
         except Exception as e:
             logger.error(f"MCP toolset validation failed: {e}")
@@ -458,11 +654,8 @@ class SystemValidator:
         """Validate ADK agent coordination"""
         try:
             # Check for ADK agent patterns
-            result = subprocess.run([
-                "grep", "-r", "SequentialAgent\\|ParallelAgent", "agentic_graphrag/"
-            ], capture_output=True, text=True)
-            
-            return result.returncode == 0 and len(result.stdout.strip()) > 0
+            source = await self._scan_tree()
+            return re.search(r"SequentialAgent|ParallelAgent", source) is not None
             
         except Exception as e:
             logger.error(f"ADK agent coordination validation failed: {e}")
@@ -472,18 +665,19 @@ class SystemValidator:
         """Validate A2A protocol compliance"""
         try:
             # Run A2A validator
-            result = subprocess.run([
+            returncode, stdout, _ = await self._run([
                 "python", "-m", "agentic_graphrag.server.a2a_utils",
                 "--server-url", self.server_url
-            ], capture_output=True, text=True, timeout=60)
+            ], 60)
             
             # Check if validation passed or server not available
-            return result.returncode == 0 or "not available" in result.stdout.lower()
+            return returncode == 0 or "not available" in stdout.lower()
             
         except Exception as e:
             logger.error(f"A2A protocol compliance validation failed: {e}")
             return False
     
+    @cached(inputs=("agentic_graphrag/config/__init__.py",))
     async def _validate_multi_database_operations(self) -> bool:
         """Validate multi-database operations"""
         try:
@@ -492,7 +686,7 @@ class SystemValidator:
             if not config_file.exists():
                 return False
             
-            content = config_file.read_text()
+            content = self._read(config_file)
             return "neo4j" in content.lower() and "lancedb" in content.lower() and "sqlite" in content.lower()
             
         except Exception as e:
@@ -503,22 +697,22 @@ class SystemValidator:
         """Validate environment configuration"""
         try:
             # Check configuration validation
-            result = subprocess.run([
+            returncode, stdout, _ = await self._run([
                 "python", "main.py", "--config-check"
-            ], capture_output=True, text=True, timeout=30)
+            ], 30)
             
-            return "VALID" in result.stdout
+            return "VALID" in stdout
             
         except Exception as e:
             logger.error(f"Environment configuration validation failed: {e}")
             return False
     
+    @cached(inputs=(A2A_UTILS_FILE,))
     async def _validate_a2a_server_validation(self) -> bool:
         """Validate A2A server validation tools"""
         try:
             # Check if validation utility exists
-            util_file = Path("agentic_graphrag/server/a2a_utils.py")
-            return util_file.exists()
+            return self._exists(A2A_UTILS_FILE)
             
         except Exception as e:
             logger.error(f"A2A server validation failed: {e}")
@@ -529,13 +723,10 @@ class SystemValidator:
     async def _validate_comprehensive_error_handling(self) -> bool:
         """Validate comprehensive error handling"""
         try:
-            # Run error handling tests
-            result = subprocess.run([
-                "python", "-m", "pytest", "tests/", 
-                "-k", "error", "--tb=short", "-q"
-            ], capture_output=True, text=True, timeout=60)
+            # Error handling tests, selected by name
+            tests = await self._pytest_tests(lambda t: "error" in t["nodeid"])
             
-            return result.returncode == 0
+            return bool(tests) and all(t["outcome"] != "failed" for t in tests)
             
         except Exception as e:
             logger.error(f"Comprehensive error handling validation failed: {e}")
@@ -549,7 +740,7 @@ class SystemValidator:
             if not main_file.exists():
                 return False
             
-            content = main_file.read_text()
+            content = self._read(main_file)
             return "logging" in content.lower() and "logger" in content.lower()
             
         except Exception as e:
@@ -559,14 +750,11 @@ class SystemValidator:
     async def _validate_performance_under_load(self) -> bool:
         """Validate performance under load"""
         try:
-            # Run performance tests
-            result = subprocess.run([
-                "python", "-m", "pytest", "tests/", 
-                "-m", "performance", "--tb=short", "-q"
-            ], capture_output=True, text=True, timeout=120)
+            # Performance-marked tests
+            tests = await self._pytest_tests(lambda t: "performance" in t["markers"])
             
             # Accept if no performance tests or if they pass
-            return result.returncode == 0 or "no tests ran" in result.stdout.lower()
+            return tests is not None and all(t["outcome"] != "failed" for t in tests)
             
         except Exception as e:
             logger.error(f"Performance validation failed: {e}")
@@ -576,51 +764,29 @@ class SystemValidator:
         """Validate security measures"""
         try:
             # Check for security-related code
-            result = subprocess.run([
-                "grep", "-r", "validation\\|sanitiz\\|auth", "agentic_graphrag/"
-            ], capture_output=True, text=True)
-            
-            return result.returncode == 0 and len(result.stdout.strip()) > 0
+            source = await self._scan_tree()
+            return re.search(r"validation|sanitiz|auth", source) is not None
             
         except Exception as e:
             logger.error(f"Security measures validation failed: {e}")
             return False
     
+    @cached(inputs=REQUIRED_DOCS)
     async def _validate_documentation_completeness(self) -> bool:
         """Validate documentation completeness"""
         try:
-            required_docs = [
-                "README.md",
-                "DEPLOYMENT.md",
-                "requirements.txt",
-                "setup.py"
-            ]
-            
-            for doc in required_docs:
-                if not Path(doc).exists():
-                    return False
-            
-            return True
+            return all(self._exists(doc) for doc in REQUIRED_DOCS)
             
         except Exception as e:
             logger.error(f"Documentation validation failed: {e}")
             return False
     
+    @cached(inputs=CONFIG_FILES)
     async def _validate_configuration_management(self) -> bool:
         """Validate configuration management"""
         try:
             # Check for configuration files
-            config_files = [
-                ".env.example",
-                "docker-compose.yml",
-                "agentic_graphrag/config/__init__.py"
-            ]
-            
-            for config_file in config_files:
-                if not Path(config_file).exists():
-                    return False
-            
-            return True
+            return all(self._exists(config_file) for config_file in CONFIG_FILES)
             
         except Exception as e:
             logger.error(f"Configuration management validation failed: {e}")
@@ -631,18 +797,13 @@ class SystemValidator:
         total_tests = len(self.results)
         passed_tests = sum(1 for r in self.results if r.success)
         
-        # Categorize results
-        core_results = [r for r in self.results if any(term in r.name.lower() for term in 
-                       ["a2a server request", "kg agent mcp", "fact extraction", "connection detection", 
-                        "notification", "concurrent", "error handling", "end-to-end"])]
-        
-        integration_results = [r for r in self.results if any(term in r.name.lower() for term in
-                              ["mcp toolset", "adk agent", "a2a protocol", "multi-database", 
-                               "environment config", "a2a server validation"])]
-        
-        production_results = [r for r in self.results if any(term in r.name.lower() for term in
-                             ["comprehensive error", "logging", "performance", "security", 
-                              "documentation", "configuration management"])]
+        # Categorize results in a single pass
+        buckets = {category: [] for category in CATEGORY_KEYWORDS}
+        for r in self.results:
+            for category, keywords in CATEGORY_KEYWORDS.items():
+                if any(keyword in r.name_lower for keyword in keywords):
+                    buckets[category].append(r)
+                    break
         
         report = {
             "summary": {
@@ -654,21 +815,12 @@ class SystemValidator:
                 "timestamp": datetime.now().isoformat()
             },
             "categories": {
-                "core_functionality": {
-                    "total": len(core_results),
-                    "passed": sum(1 for r in core_results if r.success),
-                    "tests": [{"name": r.name, "success": r.success, "details": r.details} for r in core_results]
-                },
-                "integration_quality": {
-                    "total": len(integration_results),
-                    "passed": sum(1 for r in integration_results if r.success),
-                    "tests": [{"name": r.name, "success": r.success, "details": r.details} for r in integration_results]
-                },
-                "production_readiness": {
-                    "total": len(production_results),
-                    "passed": sum(1 for r in production_results if r.success),
-                    "tests": [{"name": r.name, "success": r.success, "details": r.details} for r in production_results]
+                category: {
+                    "total": len(buckets[category]),
+                    "passed": sum(1 for r in buckets[category] if r.success),
+                    "tests": [{"name": r.name, "success": r.success, "details": r.details} for r in buckets[category]]
                 }
+                for category in REPORT_CATEGORIES
             },
             "detailed_results": [
                 {
@@ -694,74 +846,85 @@ async def main():
     parser.add_argument("--production-only", action="store_true", help="Run production readiness tests only")
     parser.add_argument("--quick", action="store_true", help="Run quick validation subset")
     parser.add_argument("--output", help="Output file for detailed report (JSON)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the cached results")
     
     args = parser.parse_args()
     
-    validator = SystemValidator()
-    
-    print("🎯 Agentic GraphRAG System - Comprehensive Validation")
-    print(f"Working directory: {Path.cwd()}")
-    print(f"Target server: {validator.server_url}")
-    print(f"Started at: {datetime.now()}")
-    
-    try:
-        if args.core_only:
-            await validator.validate_core_functionality()
-        elif args.integration_only:
-            await validator.validate_integration_quality()
-        elif args.production_only:
-            await validator.validate_production_readiness()
-        elif args.quick:
-            # Quick validation - subset of most critical tests
-            await validator._validate_a2a_server_requests()
-            await validator._validate_environment_configuration()
-            await validator._validate_documentation_completeness()
-        else:
-            # Full validation
-            await validator.validate_core_functionality()
-            await validator.validate_integration_quality()
-            await validator.validate_production_readiness()
-        
-        # Generate report
-        report = validator.generate_report()
+    async with SystemValidator(use_cache=not args.no_cache) as validator:
+        print("🎯 Agentic GraphRAG System - Comprehensive Validation")
+        print(f"Working directory: {Path.cwd()}")
+        print(f"Target server: {validator.server_url}")
+        print(f"Started at: {datetime.now()}")
         
-        # Print summary
-        print("\n" + "="*80)
-        print("📋 VALIDATION SUMMARY")
-        print("="*80)
-        
-        summary = report["summary"]
-        print(f"Total Tests: {summary['total_tests']}")
-        print(f"Passed: {summary['passed_tests']}")
-        print(f"Failed: {summary['failed_tests']}")
-        print(f"Success Rate: {summary['success_rate']:.1%}")
-        print(f"Overall Status: {summary['overall_status']}")
-        
-        # Category breakdown
-        for category, data in report["categories"].items():
-            if data["total"] > 0:
-                print(f"\n{category.replace('_', ' ').title()}: {data['passed']}/{data['total']} passed")
-        
-        # Save detailed report if requested
-        if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(report, f, indent=2)
-            print(f"\n📄 Detailed report saved to: {args.output}")
-        
-        # Final result
-        if summary["overall_status"] == "PASS":
-            print("\n🎉 All validations passed! System is ready for production deployment.")
-            return 0
-        else:
-            print(f"\n⚠️  {summary['failed_tests']} validation(s) failed. Please review the results above.")
-            return 1
+        try:
+            if args.core_only:
+                await validator.validate_core_functionality()
+                validator.flush_prints()
+            elif args.integration_only:
+                await validator.validate_integration_quality()
+                validator.flush_prints()
+            elif args.production_only:
+                await validator.validate_production_readiness()
+                validator.flush_prints()
+            elif args.quick:
+                # Quick validation - subset of most critical tests
+                await validator._validate_a2a_server_requests()
+                await validator._validate_environment_configuration()
+                await validator._validate_documentation_completeness()
+            else:
+                # Full validation
+                await validator.validate_core_functionality()
+                validator.flush_prints()
+                await validator.validate_integration_quality()
+                validator.flush_prints()
+                await validator.validate_production_readiness()
+                validator.flush_prints()
             
-    except KeyboardInterrupt:
-        print("\n\n⚠️  Validation interrupted by user")
-        return 1
-    except Exception as e:
-        print(f"\n❌ Validation failed with error: {e}")
-        return 1
+            # Generate report
+            report = validator.generate_report()
+            
+            # Print summary
+            print("\n" + "="*80)
+            print("📋 VALIDATION SUMMARY")
+            print("="*80)
+            
+            summary = report["summary"]
+            print(f"Total Tests: {summary['total_tests']}")
+            print(f"Passed: {summary['passed_tests']}")
+            print(f"Failed: {summary['failed_tests']}")
+            print(f"Success Rate: {summary['success_rate']:.1%}")
+            print(f"Overall Status: {summary['overall_status']}")
+            
+            # Category breakdown
+            for category, data in report["categories"].items():
+                if data["total"] > 0:
+                    print(f"\n{category.replace('_', ' ').title()}: {data['passed']}/{data['total']} passed")
+            
+            # Save detailed report if requested
+            if args.output:
+                if orjson is not None:
+                    with open(args.output, 'wb') as f:
+                        f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(args.output, 'w') as f:
+                        json.dump(report, f, indent=2)
+                print(f"\n📄 Detailed report saved to: {args.output}")
+            
+            # Final result
+            if summary["overall_status"] == "PASS":
+                print("\n🎉 All validations passed! System is ready for production deployment.")
+                return 0
+            else:
+                print(f"\n⚠️  {summary['failed_tests']} validation(s) failed. Please review the results above.")
+                return 1
+                
+        except KeyboardInterrupt:
+            print("\n\n⚠️  Validation interrupted by user")
+            return 1
+        except Exception as e:
+            validator.flush_prints()
+            print(f"\n❌ Validation failed with error: {e}")
+            return 1
 
 if __name__ == "__main__":
     sys.exit(asyncio.run(main()))
\ No newline at end of file
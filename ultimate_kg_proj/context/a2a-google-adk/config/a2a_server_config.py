@@ -6,51 +6,83 @@ hosting Google ADK agents with proper Google Cloud integration.
 """
 
 import os
+import sys
 import asyncio
+import functools
 import logging
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
 
 from a2a_sdk import A2AServer, A2AServerConfig
-from google.cloud import aiplatform
-from google.auth import default
-import uvicorn
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+
 logger = logging.getLogger(__name__)
 
+# Environment lookups are cached for the life of the process. Call
+# _env.cache_clear() (and the typed variants) after changing os.environ, or
+# pass overrides to GoogleCloudA2AServerConfig(...) instead, e.g. in tests.
+@functools.lru_cache(maxsize=None)
+def _env(key: str, default: Optional[str] = None) -> Optional[str]:
+    """Read an environment variable once"""
+    return os.environ.get(key, default)
+
+@functools.lru_cache(maxsize=None)
+def _env_int(key: str, default: int) -> int:
+    """Read an integer environment variable once"""
+    return int(_env(key, str(default)))
+
+@functools.lru_cache(maxsize=None)
+def _env_bool(key: str, default: bool) -> bool:
+    """Read a true/false environment variable once"""
+    return _env(key, str(default).lower()).lower() == "true"
+
+# Dataclass fields that default to an environment variable, read when the config is built
+def _from_env(key: str, default: Optional[str] = None, **field_kwargs):
+    """Field defaulting to a string environment variable"""
+    return field(default_factory=functools.partial(_env, key, default), **field_kwargs)
+
+def _from_env_int(key: str, default: int):
+    """Field defaulting to an integer environment variable"""
+    return field(default_factory=functools.partial(_env_int, key, default))
+
+def _from_env_bool(key: str, default: bool):
+    """Field defaulting to a true/false environment variable"""
+    return field(default_factory=functools.partial(_env_bool, key, default))
+
+# Google Cloud setup shared by every server manager in the process:
+# default() credentials, and the (project, location) aiplatform was initialized for
+_CREDS_CACHE: Optional[Tuple] = None
+_AIPLATFORM_INIT_KEY: Optional[Tuple[Optional[str], str]] = None
+_GOOGLE_CLOUD_LOCK = asyncio.Lock()
+
+@dataclass(frozen=True, slots=True)
 class GoogleCloudA2AServerConfig:
-    """Configuration class for A2A server with Google Cloud integration"""
+    """Configuration class for A2A server with Google Cloud integration (immutable)"""
+    
+    server_host: str = _from_env("A2A_SERVER_HOST", "0.0.0.0")
+    server_port: int = _from_env_int("A2A_SERVER_PORT", 8080)
+    network_mode: str = _from_env("A2A_NETWORK_MODE", "development")
+    
+    # Google Cloud configuration
+    google_project: Optional[str] = _from_env("GOOGLE_CLOUD_PROJECT")
+    vertex_ai_location: str = _from_env("VERTEX_AI_LOCATION", "us-central1")
+    google_credentials: Optional[str] = _from_env("GOOGLE_APPLICATION_CREDENTIALS")
+    
+    # A2A protocol configuration
+    a2a_protocol_version: str = _from_env("A2A_PROTOCOL_VERSION", "1.0")
+    max_concurrent_requests: int = _from_env_int("A2A_MAX_CONCURRENT_REQUESTS", 100)
+    request_timeout: int = _from_env_int("A2A_REQUEST_TIMEOUT", 30)
+    
+    # Security configuration
+    tls_enabled: bool = _from_env_bool("A2A_TLS_ENABLED", False)
+    tls_cert_file: Optional[str] = _from_env("A2A_TLS_CERT_FILE")
+    tls_key_file: Optional[str] = _from_env("A2A_TLS_KEY_FILE")
+    api_key_secret: Optional[str] = _from_env("A2A_AGENT_API_KEY_SECRET", repr=False)
+    
+    # Monitoring configuration
+    enable_metrics: bool = _from_env_bool("A2A_ENABLE_METRICS", True)
+    metrics_port: int = _from_env_int("A2A_METRICS_PORT", 9090)
     
-    def __init__(self):
-        self.server_host = os.getenv("A2A_SERVER_HOST", "0.0.0.0")
-        self.server_port = int(os.getenv("A2A_SERVER_PORT", "8080"))
-        self.network_mode = os.getenv("A2A_NETWORK_MODE", "development")
-        
-        # Google Cloud configuration
-        self.google_project = os.getenv("GOOGLE_CLOUD_PROJECT")
-        self.vertex_ai_location = os.getenv("VERTEX_AI_LOCATION", "us-central1")
-        self.google_credentials = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-        
-        # A2A protocol configuration
-        self.a2a_protocol_version = os.getenv("A2A_PROTOCOL_VERSION", "1.0")
-        self.max_concurrent_requests = int(os.getenv("A2A_MAX_CONCURRENT_REQUESTS", "100"))
-        self.request_timeout = int(os.getenv("A2A_REQUEST_TIMEOUT", "30"))
-        
-        # Security configuration
-        self.tls_enabled = os.getenv("A2A_TLS_ENABLED", "false").lower() == "true"
-        self.tls_cert_file = os.getenv("A2A_TLS_CERT_FILE")
-        self.tls_key_file = os.getenv("A2A_TLS_KEY_FILE")
-        self.api_key_secret = os.getenv("A2A_AGENT_API_KEY_SECRET")
-        
-        # Monitoring configuration
-        self.enable_metrics = os.getenv("A2A_ENABLE_METRICS", "true").lower() == "true"
-        self.metrics_port = int(os.getenv("A2A_METRICS_PORT", "9090"))
-        
     def validate(self) -> bool:
         """Validate configuration settings"""
         if not self.google_project:
@@ -63,6 +95,16 @@ class GoogleCloudA2AServerConfig:
             
         return True
 
+@functools.lru_cache(maxsize=None)
+def get_server_config(**overrides) -> GoogleCloudA2AServerConfig:
+    """
+    Get the process-wide server configuration, built on first use
+    
+    Keyword overrides (e.g. server_port=9000) take precedence over the
+    environment; each distinct set of overrides is built once.
+    """
+    return GoogleCloudA2AServerConfig(**overrides)
+
 class A2AServerManager:
     """Manager class for A2A server with Google Cloud integration"""
     
@@ -70,22 +112,47 @@ class A2AServerManager:
         self.config = config
         self.server: Optional[A2AServer] = None
         self.registered_agents: Dict[str, any] = {}
+        # get_server_info is polled by health checks: keep the agent ids and
+        # the static config fields ready instead of rebuilding them per call
+        self._agent_ids: List[str] = []
+        self._info_template = {
+            "server_host": config.server_host,
+            "server_port": config.server_port,
+            "network_mode": config.network_mode,
+            "protocol_version": config.a2a_protocol_version,
+            "google_project": config.google_project,
+            "vertex_ai_location": config.vertex_ai_location
+        }
         
     async def initialize_google_cloud(self):
         """Initialize Google Cloud services"""
+        global _CREDS_CACHE, _AIPLATFORM_INIT_KEY
+        # Imported here: the Google Cloud SDK is heavy and only this path needs it
+        from google.cloud import aiplatform
+        from google.auth import default
+        
         try:
-            # Initialize Vertex AI
-            aiplatform.init(
-                project=self.config.google_project,
-                location=self.config.vertex_ai_location
-            )
+            async with _GOOGLE_CLOUD_LOCK:
+                # Initialize Vertex AI, unless already done for this project/location
+                init_key = (self.config.google_project, self.config.vertex_ai_location)
+                if _AIPLATFORM_INIT_KEY != init_key:
+                    # init() is synchronous SDK setup (file and network I/O)
+                    await asyncio.to_thread(
+                        aiplatform.init,
+                        project=self.config.google_project,
+                        location=self.config.vertex_ai_location
+                    )
+                    _AIPLATFORM_INIT_KEY = init_key
+                
+                # Verify authentication (credentials are looked up once per process)
+                if _CREDS_CACHE is None:
+                    _CREDS_CACHE = await asyncio.to_thread(default)
+                credentials, project = _CREDS_CACHE
             
-            # Verify authentication
-            credentials, project = default()
-            logger.info(f"Google Cloud initialized for project: {project}")
+            logger.info("Google Cloud initialized for project: %s", project)
             
         except Exception as e:
-            logger.error(f"Failed to initialize Google Cloud: {e}")
+            logger.error("Failed to initialize Google Cloud: %s", e)
             raise
     
     async def create_server(self) -> A2AServer:
@@ -112,21 +179,60 @@ class A2AServerManager:
             raise RuntimeError("Server not initialized")
             
         agent_id = agent.name
+        if agent_id not in self.registered_agents:
+            self._agent_ids.append(agent_id)
         self.registered_agents[agent_id] = {
             "agent": agent,
             "capabilities": capabilities,
-            "registered_at": asyncio.get_event_loop().time()
+            "registered_at": asyncio.get_running_loop().time()
         }
         
         await self.server.register_agent(agent_id, capabilities)
-        logger.info(f"Registered agent: {agent_id}")
+        logger.info("Registered agent: %s", agent_id)
+    
+    async def register_agents(self, agents: List[Tuple[Any, Dict]]):
+        """Register several (agent, capabilities) pairs with the A2A server at once"""
+        if not self.server:
+            raise RuntimeError("Server not initialized")
+        
+        payload = [(agent.name, capabilities) for agent, capabilities in agents]
+        
+        # One bulk call when the server supports it, otherwise concurrent registrations
+        register_bulk = getattr(self.server, "register_agents_bulk", None)
+        if register_bulk is not None:
+            await register_bulk(payload)
+            results = [None] * len(payload)
+        else:
+            results = await asyncio.gather(
+                *(self.server.register_agent(agent_id, capabilities) for agent_id, capabilities in payload),
+                return_exceptions=True
+            )
+        
+        # Record the agents that registered, then surface the first failure
+        registered_at = asyncio.get_running_loop().time()
+        registered = {
+            agent.name: {
+                "agent": agent,
+                "capabilities": capabilities,
+                "registered_at": registered_at
+            }
+            for (agent, capabilities), result in zip(agents, results)
+            if not isinstance(result, Exception)
+        }
+        self._agent_ids.extend(agent_id for agent_id in registered if agent_id not in self.registered_agents)
+        self.registered_agents.update(registered)
+        logger.info("Registered %d agents", len(registered))
+        
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            raise errors[0]
     
     async def start_server(self):
         """Start the A2A server"""
         if not self.server:
             raise RuntimeError("Server not created")
             
-        logger.info(f"Starting A2A server on {self.config.server_host}:{self.config.server_port}")
+        logger.info("Starting A2A server on %s:%s", self.config.server_host, self.config.server_port)
         
         if self.config.network_mode == "production":
             logger.info("Running in production mode with enhanced security")
@@ -142,22 +248,18 @@ class A2AServerManager:
     def get_server_info(self) -> Dict:
         """Get server information and status"""
         return {
-            "server_host": self.config.server_host,
-            "server_port": self.config.server_port,
-            "network_mode": self.config.network_mode,
-            "protocol_version": self.config.a2a_protocol_version,
-            "registered_agents": len(self.registered_agents),
-            "agent_list": list(self.registered_agents.keys()),
-            "google_project": self.config.google_project,
-            "vertex_ai_location": self.config.vertex_ai_location
+            **self._info_template,
+            "registered_agents": len(self._agent_ids),
+            "agent_list": self._agent_ids.copy()
         }
 
-async def setup_a2a_server_with_google_adk():
+async def setup_a2a_server_with_google_adk(config: Optional[GoogleCloudA2AServerConfig] = None):
     """
     Complete setup function for A2A server with Google ADK agents
     """
     # Load configuration
-    config = GoogleCloudA2AServerConfig()
+    if config is None:
+        config = get_server_config()
     
     if not config.validate():
         raise RuntimeError("Invalid configuration")
@@ -172,51 +274,93 @@ async def setup_a2a_server_with_google_adk():
     await server_manager.create_server()
     
     logger.info("A2A server setup completed successfully")
-    logger.info(f"Server info: {server_manager.get_server_info()}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Server info: %s", server_manager.get_server_info())
     
     return server_manager
 
 def create_production_server_config():
-    """Create production server configuration"""
+    """
+    Create production server configuration
+    
+    uvicorn serves one worker per process here; for multiple workers run the
+    app under gunicorn instead, e.g. ``gunicorn -k uvicorn_worker.UvicornWorker -w 4``.
+    """
     return {
         "host": "0.0.0.0",
         "port": 8080,
-        "workers": 4,
-        "log_level": "info",
-        "access_log": True,
+        "workers": 1,
+        "loop": "uvloop",
+        "http": "httptools",
+        "log_level": "warning",
+        "access_log": False,
         "use_colors": False,
         "server_header": False,
         "date_header": False
     }
 
-async def main():
+async def main(config: Optional[GoogleCloudA2AServerConfig] = None):
     """Main function for running A2A server"""
     try:
         # Setup server
-        server_manager = await setup_a2a_server_with_google_adk()
+        server_manager = await setup_a2a_server_with_google_adk(config)
         
         # Start server
         await server_manager.start_server()
         
     except Exception as e:
-        logger.error(f"Failed to start A2A server: {e}")
+        logger.error("Failed to start A2A server: %s", e)
         raise
     finally:
         if 'server_manager' in locals():
             await server_manager.shutdown()
 
-def run_production_server():
-    """Run server in production mode with uvicorn"""
-    config = create_production_server_config()
+def run_on_event_loop(coro):
+    """Run a coroutine to completion, on uvloop when it is installed"""
+    try:
+        import uvloop
+    except ImportError:  # optional: pip install "uvicorn[standard]"
+        return asyncio.run(coro)
     
-    uvicorn.run(
-        "a2a_server_config:main",
-        **config
-    )
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    uvloop.install()
+    return asyncio.run(coro)
+
+async def serve_production(uvicorn_config: Dict, config: Optional[GoogleCloudA2AServerConfig] = None):
+    """Serve the A2A server's ASGI app with uvicorn on the current loop"""
+    import uvicorn
+    
+    server_manager = await setup_a2a_server_with_google_adk(config)
+    try:
+        # workers and loop only apply to uvicorn.run; here the loop is already running
+        server_config = {k: v for k, v in uvicorn_config.items() if k not in ("workers", "loop")}
+        # Listen where the A2A configuration (including CLI overrides) says
+        server_config["host"] = server_manager.config.server_host
+        server_config["port"] = server_manager.config.server_port
+        server = uvicorn.Server(uvicorn.Config(server_manager.server.asgi_app, **server_config))
+        await server.serve()
+    finally:
+        await server_manager.shutdown()
+
+def run_production_server(config: Optional[GoogleCloudA2AServerConfig] = None):
+    """Run server in production mode with uvicorn on uvloop"""
+    uvicorn_config = create_production_server_config()
+    
+    # uvicorn needs an ASGI app, not the main() coroutine, so the server is
+    # set up first and its app served on the same (uvloop) event loop
+    run_on_event_loop(serve_production(uvicorn_config, config))
 
 if __name__ == "__main__":
     import argparse
     
+    # Configure logging (only when run as a script, not on import)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     parser = argparse.ArgumentParser(description="A2A Server for Google ADK Agents")
     parser.add_argument("--mode", choices=["development", "production"], 
                        default="development", help="Server mode")
@@ -226,13 +370,13 @@ if __name__ == "__main__":
     
     args = parser.parse_args()
     
+    # CLI options override the environment without writing back to os.environ
+    overrides = {"network_mode": args.mode}
     if args.port:
-        os.environ["A2A_SERVER_PORT"] = str(args.port)
-    
-    os.environ["A2A_NETWORK_MODE"] = args.mode
+        overrides["server_port"] = args.port
+    config = get_server_config(**overrides)
     
     if args.validate:
-        config = GoogleCloudA2AServerConfig()
         if config.validate():
             print("Configuration is valid")
         else:
@@ -240,6 +384,6 @@ if __name__ == "__main__":
             exit(1)
     else:
         if args.mode == "production":
-            run_production_server()
+            run_production_server(config)
         else:
-            asyncio.run(main())
\ No newline at end of file
+            run_on_event_loop(main(config))
\ No newline at end of file
@@ -10,8 +10,50 @@ import os
 import sys
 import shutil
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Optional, Tuple
+
+# Template files to copy, relative to the template directory
+_TEMPLATE_FILES: Tuple[str, ...] = (
+    "CLAUDE.md",
+    "README.md",
+    ".claude/commands/generate-a2a-google-adk-prp.md",
+    ".claude/commands/execute-a2a-google-adk-prp.md",
+    "PRPs/templates/prp_a2a_google_adk_base.md",
+    "PRPs/ai_docs/a2a_protocol_patterns.md",
+    "PRPs/ai_docs/google_adk_integration.md", 
+    "PRPs/ai_docs/cross_platform_agent_coordination.md",
+    "PRPs/INITIAL.md",
+    "examples/basic_a2a_agent/agent.py",
+    "examples/basic_a2a_agent/requirements.txt",
+    "examples/a2a_server_setup/setup_server.py",
+    "examples/a2a_server_setup/docker-compose.yml",
+    "examples/cross_platform_delegation/test_delegation.py",
+    "examples/cross_platform_delegation/langraph_integration.py",
+    "examples/cross_platform_delegation/crewai_integration.py",
+    "examples/multi_agent_coordination/coordinator.py",
+    "examples/google_cloud_deployment/cloudbuild.yaml",
+    "examples/google_cloud_deployment/Dockerfile",
+    "examples/a2a_testing_framework/test_compliance.py",
+    "config/a2a_server_config.py",
+    "config/google_cloud_config.py",
+    "config/agent_registry.py",
+    "requirements.txt",
+    ".env.example",
+    ".gitignore"
+)
+
+# Optional project files copied when present in the template directory
+_ADDITIONAL_FILES: Tuple[str, ...] = (
+    "pyproject.toml",
+    "setup.py", 
+    "poetry.lock",
+    "package.json"
+)
+
+# Copied files whose executable bits are preserved
+_SCRIPT_SUFFIXES = frozenset({".py", ".sh"})
 
 def print_banner():
     """Print the template copy banner"""
@@ -25,46 +67,28 @@ def print_banner():
 ╚══════════════════════════════════════════════════════════════════════╝
     """)
 
-def get_template_files() -> List[str]:
+def get_template_files() -> Tuple[str, ...]:
     """Get list of all template files to copy"""
-    return [
-        "CLAUDE.md",
-        "README.md",
-        ".claude/commands/generate-a2a-google-adk-prp.md",
-        ".claude/commands/execute-a2a-google-adk-prp.md",
-        "PRPs/templates/prp_a2a_google_adk_base.md",
-        "PRPs/ai_docs/a2a_protocol_patterns.md",
-        "PRPs/ai_docs/google_adk_integration.md", 
-        "PRPs/ai_docs/cross_platform_agent_coordination.md",
-        "PRPs/INITIAL.md",
-        "examples/basic_a2a_agent/agent.py",
-        "examples/basic_a2a_agent/requirements.txt",
-        "examples/a2a_server_setup/setup_server.py",
-        "examples/a2a_server_setup/docker-compose.yml",
-        "examples/cross_platform_delegation/test_delegation.py",
-        "examples/cross_platform_delegation/langraph_integration.py",
-        "examples/cross_platform_delegation/crewai_integration.py",
-        "examples/multi_agent_coordination/coordinator.py",
-        "examples/google_cloud_deployment/cloudbuild.yaml",
-        "examples/google_cloud_deployment/Dockerfile",
-        "examples/a2a_testing_framework/test_compliance.py",
-        "config/a2a_server_config.py",
-        "config/google_cloud_config.py",
-        "config/agent_registry.py",
-        "requirements.txt",
-        ".env.example",
-        ".gitignore"
-    ]
+    return _TEMPLATE_FILES
 
 def copy_file(src_path: Path, dst_path: Path, template_dir: Path) -> bool:
-    """Copy a single file, creating directories as needed"""
+    """
+    Copy a single file, creating directories as needed
+    
+    Only file contents are copied (timestamps and permissions follow the
+    umask), except that scripts keep their executable bits.
+    """
     try:
         # Create destination directory if it doesn't exist
         dst_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Copy the file
         if src_path.exists():
-            shutil.copy2(src_path, dst_path)
+            shutil.copyfile(src_path, dst_path)
+            if src_path.suffix in _SCRIPT_SUFFIXES:
+                exec_bits = src_path.stat().st_mode & 0o111
+                if exec_bits:
+                    os.chmod(dst_path, dst_path.stat().st_mode | exec_bits)
             return True
         else:
             print(f"Warning: Source file not found: {src_path}")
@@ -93,8 +117,13 @@ def copy_template(target_dir: str, template_dir: Optional[str] = None) -> bool:
     
     target_path = Path(target_dir).resolve()
     
-    # Validate target directory
-    if target_path.exists() and any(target_path.iterdir()):
+    # Validate target directory (stop at the first entry; no per-entry stat)
+    non_empty = False
+    if target_path.exists():
+        with os.scandir(target_path) as entries:
+            non_empty = next(entries, None) is not None
+    
+    if non_empty:
         response = input(f"Target directory '{target_path}' is not empty. Continue? (y/N): ")
         if response.lower() != 'y':
             print("Template copy cancelled.")
@@ -109,32 +138,36 @@ def copy_template(target_dir: str, template_dir: Optional[str] = None) -> bool:
     files_copied = 0
     files_failed = 0
     
-    for file_path in get_template_files():
-        src_file = template_dir / file_path
-        dst_file = target_path / file_path
-        
-        if copy_file(src_file, dst_file, template_dir):
-            files_copied += 1
-            print(f"✓ {file_path}")
-        else:
-            files_failed += 1
-            print(f"✗ {file_path}")
-    
-    # Copy any additional files that exist
-    additional_files = [
-        "pyproject.toml",
-        "setup.py", 
-        "poetry.lock",
-        "package.json"
+    # Resolve every source/destination pair once, up front, including any
+    # additional files that exist (those are not counted as failures)
+    file_pairs = [
+        (file_path, template_dir / file_path, target_path / file_path, False)
+        for file_path in _TEMPLATE_FILES
+    ]
+    file_pairs += [
+        (file_path, template_dir / file_path, target_path / file_path, True)
+        for file_path in _ADDITIONAL_FILES
+        if (template_dir / file_path).exists()
     ]
     
-    for file_path in additional_files:
-        src_file = template_dir / file_path
-        if src_file.exists():
-            dst_file = target_path / file_path
-            if copy_file(src_file, dst_file, template_dir):
+    # Create each destination directory once, before the parallel copies
+    for parent in {dst_file.parent for _, _, dst_file, _ in file_pairs}:
+        parent.mkdir(parents=True, exist_ok=True)
+    
+    # Copies are independent and I/O bound, so run them on a thread pool;
+    # map() yields results in file order, keeping the progress output stable
+    max_workers = min(8, (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            lambda pair: copy_file(pair[1], pair[2], template_dir), file_pairs
+        )
+        for (file_path, _, _, additional), copied in zip(file_pairs, results):
+            if copied:
                 files_copied += 1
-                print(f"✓ {file_path} (additional)")
+                print(f"✓ {file_path}{' (additional)' if additional else ''}")
+            elif not additional:
+                files_failed += 1
+                print(f"✗ {file_path}")
     
     # Print summary
     print(f"\nTemplate copy completed:")
@@ -7,17 +7,119 @@ using Google ADK with Vertex AI integration.
 
 import asyncio
 import logging
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Set, Tuple
 from dataclasses import dataclass
 
 from a2a_sdk import A2AServer, A2ACompatibleAgent
+import google.auth
 from google.cloud import aiplatform
 from google_adk import GoogleADKAgent, VertexAIModel
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Micro-batching of Vertex AI calls: concurrent prompts arriving within
+# BATCH_WINDOW seconds are sent together, up to BATCH_MAX per call
+BATCH_MAX = 8
+BATCH_WINDOW = 0.010
+MAX_CONCURRENT_BATCHES = 4
+
+class _BatchQueue:
+    """Coalesce concurrent generate_text calls into batched Vertex AI calls
+    
+    The model must provide generate_text_batch; without it batching only adds latency.
+    """
+    
+    def __init__(self, model, max_batch: int = BATCH_MAX, window: float = BATCH_WINDOW,
+                 max_concurrent_batches: int = MAX_CONCURRENT_BATCHES):
+        self._model = model
+        self._max_batch = max_batch
+        self._window = window
+        self._queue: "asyncio.Queue[Tuple[str, asyncio.Future]]" = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(max_concurrent_batches)
+        self._batches: Set[asyncio.Task] = set()
+        self._worker: Optional[asyncio.Task] = None
+    
+    def start(self):
+        """Start the background batching worker on the running loop"""
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Stop batching and wait for in-flight batches to finish"""
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+        await asyncio.gather(*self._batches, return_exceptions=True)
+        # Fail anything still queued rather than leaving callers waiting
+        while not self._queue.empty():
+            self._fail([self._queue.get_nowait()])
+    
+    @staticmethod
+    def _fail(batch: List[Tuple[str, asyncio.Future]], message: str = "Vertex AI batcher stopped"):
+        """Fail the futures of prompts that will never get a response"""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(RuntimeError(message))
+    
+    async def generate_text(self, prompt: str):
+        """Queue a prompt and wait for its response"""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((prompt, future))
+        return await future
+    
+    async def _run(self):
+        while True:
+            batch: List[Tuple[str, asyncio.Future]] = []
+            dispatched = False
+            try:
+                batch.append(await self._queue.get())
+                # A lone prompt goes out at once; otherwise give concurrent
+                # requests one window to join this batch
+                if not self._queue.empty():
+                    await asyncio.sleep(self._window)
+                    while len(batch) < self._max_batch and not self._queue.empty():
+                        batch.append(self._queue.get_nowait())
+                
+                await self._semaphore.acquire()
+                task = asyncio.create_task(self._dispatch(batch))
+                dispatched = True
+                self._batches.add(task)
+                task.add_done_callback(self._batches.discard)
+            finally:
+                # Cancelled by stop() while collecting: these prompts are in no task
+                if not dispatched:
+                    self._fail(batch)
+    
+    async def _dispatch(self, batch: List[Tuple[str, asyncio.Future]]):
+        try:
+            prompts = [prompt for prompt, _ in batch]
+            try:
+                if len(prompts) == 1:
+                    responses = [await self._model.generate_text(prompts[0])]
+                else:
+                    responses = await self._model.generate_text_batch(prompts)
+            except Exception as e:
+                responses = [e] * len(prompts)
+            
+            if len(responses) != len(batch):
+                # Responses can't be matched to prompts; fail them all
+                self._fail(batch, f"Vertex AI returned {len(responses)} responses for {len(batch)} prompts")
+                return
+            
+            for (_, future), response in zip(batch, responses):
+                if future.done():  # the caller gave up waiting
+                    continue
+                if isinstance(response, Exception):
+                    future.set_exception(response)
+                else:
+                    future.set_result(response)
+        finally:
+            # Cancelled mid-call: never leave a caller waiting
+            self._fail(batch)
+            self._semaphore.release()
+
 @dataclass
 class A2ACapabilities:
     """Agent capabilities for A2A discovery"""
@@ -38,10 +140,24 @@ class BasicA2AGooogleADKAgent(A2ACompatibleAgent):
     - Communicate with agents on other platforms
     """
     
+    # Application Default Credentials, loaded once per process and shared by all agents
+    _credentials = None
+    _credentials_lock = asyncio.Lock()
+    
+    @classmethod
+    async def _load_credentials(cls):
+        """Load Google credentials and their project off the event loop, once per process"""
+        async with cls._credentials_lock:
+            if cls._credentials is None:
+                # default() reads credential files and may query the metadata server
+                cls._credentials = await asyncio.to_thread(google.auth.default)
+        return cls._credentials
+    
     def __init__(self, name: str, model: str = "gemini-1.5-pro"):
         super().__init__(name)
         self.model_name = model
         self.vertex_ai_model = None
+        self._batcher: Optional[_BatchQueue] = None
         self.capabilities = A2ACapabilities(
             tasks=["text_generation", "text_analysis", "question_answering"],
             tools=["vertex_ai", "google_search", "text_processing"],
@@ -50,29 +166,71 @@ class BasicA2AGooogleADKAgent(A2ACompatibleAgent):
             platform="google-adk"
         )
         
+        # Capabilities never change after construction, so the discovery payload
+        # is built once and shared read-only; its lists are copies, so they
+        # are not aliases of self.capabilities (treat them as read-only too)
+        self._capabilities_payload: Mapping[str, Any] = MappingProxyType({
+            "agent_id": self.name,
+            "platform": self.capabilities.platform,
+            "protocols": list(self.capabilities.protocols),
+            "supported_tasks": list(self.capabilities.tasks),
+            "available_tools": list(self.capabilities.tools),
+            "models": list(self.capabilities.models),
+            "version": "1.0.0",
+            "description": "A2A-compatible Google ADK agent with Vertex AI integration"
+        })
+        
+        # Fields shared by every A2A response envelope (metadata is copied per response)
+        self._response_prefix = {
+            "agent_id": self.name,
+            "platform": self.capabilities.platform
+        }
+        self._response_metadata = {
+            "model_used": self.model_name,
+            "processing_time": "calculated_processing_time"
+        }
+        
     async def initialize(self):
         """Initialize the agent with Google Cloud and Vertex AI"""
         try:
-            # Initialize Vertex AI
-            aiplatform.init()
+            # Initialize Vertex AI with the shared credentials, so the SDK's
+            # clients reuse them instead of looking them up again on first use;
+            # aiplatform.init() is synchronous SDK setup, so keep it off the event loop
+            credentials, project = await self._load_credentials()
+            await asyncio.to_thread(aiplatform.init, credentials=credentials, project=project)
             self.vertex_ai_model = VertexAIModel(self.model_name)
-            logger.info(f"Initialized agent '{self.name}' with model {self.model_name}")
+            
+            # Warm up the model client so the first A2A request does not pay for
+            # lazy client construction, token fetch and connection setup
+            try:
+                await self.vertex_ai_model.generate_text("warmup")
+            except Exception as e:
+                logger.warning("Vertex AI warmup failed, continuing: %s", e)
+            
+            # Batch only when the model has a batch call; otherwise call it directly
+            if hasattr(self.vertex_ai_model, "generate_text_batch"):
+                self._batcher = _BatchQueue(self.vertex_ai_model)
+                self._batcher.start()
+            logger.info("Initialized agent '%s' with model %s", self.name, self.model_name)
         except Exception as e:
-            logger.error(f"Failed to initialize agent: {e}")
+            logger.error("Failed to initialize agent: %s", e)
             raise
     
-    async def get_capabilities(self) -> Dict[str, Any]:
-        """Return agent capabilities for A2A discovery"""
-        return {
-            "agent_id": self.name,
-            "platform": self.capabilities.platform,
-            "protocols": self.capabilities.protocols,
-            "supported_tasks": self.capabilities.tasks,
-            "available_tools": self.capabilities.tools,
-            "models": self.capabilities.models,
-            "version": "1.0.0",
-            "description": "A2A-compatible Google ADK agent with Vertex AI integration"
-        }
+    async def close(self):
+        """Stop the Vertex AI request batcher"""
+        if self._batcher is not None:
+            await self._batcher.stop()
+            self._batcher = None
+    
+    async def _generate(self, prompt: str):
+        """Generate text with Vertex AI, batched with concurrent requests when supported"""
+        if self._batcher is None:
+            return await self.vertex_ai_model.generate_text(prompt)
+        return await self._batcher.generate_text(prompt)
+    
+    async def get_capabilities(self) -> Mapping[str, Any]:
+        """Return agent capabilities for A2A discovery (a shared, read-only mapping)"""
+        return self._capabilities_payload
     
     async def handle_a2a_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -89,7 +247,7 @@ class BasicA2AGooogleADKAgent(A2ACompatibleAgent):
             content = request.get("content", "")
             context = request.get("context", {})
             
-            logger.info(f"Handling A2A request: {task_type}")
+            logger.info("Handling A2A request: %s", task_type)
             
             # Route to appropriate handler based on task type
             if task_type == "text_generation":
@@ -103,21 +261,16 @@ class BasicA2AGooogleADKAgent(A2ACompatibleAgent):
             
             return {
                 "status": "success",
-                "agent_id": self.name,
-                "platform": self.capabilities.platform,
+                **self._response_prefix,
                 "result": result,
-                "metadata": {
-                    "model_used": self.model_name,
-                    "processing_time": "calculated_processing_time"
-                }
+                "metadata": dict(self._response_metadata)
             }
             
         except Exception as e:
-            logger.error(f"Error handling A2A request: {e}")
+            logger.error("Error handling A2A request: %s", e)
             return {
                 "status": "error",
-                "agent_id": self.name,
-                "platform": self.capabilities.platform,
+                **self._response_prefix,
                 "error": str(e),
                 "error_type": type(e).__name__
             }
@@ -128,14 +281,14 @@ class BasicA2AGooogleADKAgent(A2ACompatibleAgent):
         if context.get("style"):
             prompt += f" Style: {context['style']}"
         
-        response = await self.vertex_ai_model.generate_text(prompt)
+        response = await self._generate(prompt)
         return response.text
     
     async def _handle_text_analysis(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Handle text analysis requests"""
         prompt = f"Analyze the following text and provide insights: {content}"
         
-        response = await self.vertex_ai_model.generate_text(prompt)
+        response = await self._generate(prompt)
         
         return {
             "analysis": response.text,
@@ -153,14 +306,14 @@ class BasicA2AGooogleADKAgent(A2ACompatibleAgent):
         if background_context:
             prompt = f"Context: {background_context}\n\n{prompt}"
         
-        response = await self.vertex_ai_model.generate_text(prompt)
+        response = await self._generate(prompt)
         return response.text
     
     async def _handle_generic_request(self, content: str, context: Dict[str, Any]) -> str:
         """Handle generic requests when task type is not specified"""
         prompt = f"Process this request: {content}"
         
-        response = await self.vertex_ai_model.generate_text(prompt)
+        response = await self._generate(prompt)
         return response.text
 
 async def main():
@@ -178,7 +331,7 @@ async def main():
     await server.register_agent(agent)
     
     logger.info("A2A server started with Google ADK agent")
-    logger.info(f"Agent capabilities: {await agent.get_capabilities()}")
+    logger.info("Agent capabilities: %s", dict(await agent.get_capabilities()))
     
     # Start server (this would run indefinitely in production)
     try:
@@ -186,6 +339,9 @@ async def main():
     except KeyboardInterrupt:
         logger.info("Shutting down A2A server")
         await server.shutdown()
+        await agent.close()
 
 if __name__ == "__main__":
+    # Configure logging (only when run as a script, not on import)
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(main())
\ No newline at end of file
@@ -7,13 +7,26 @@ with customization options for project name, databases, and configuration.
 """
 
 import os
+import re
 import shutil
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Pattern, Tuple
 import uuid
 
 
+# Files and directories to skip during copy, matched on their name alone
+SKIP_NAMES = frozenset({
+    "__pycache__",
+    ".git",
+    ".pytest_cache",
+    ".DS_Store",
+    "copy_template.py"  # Don't copy the template script itself
+})
+SKIP_SUFFIXES = (".pyc",)
+
+
 def generate_project_id() -> str:
     """Generate a unique project identifier."""
     return str(uuid.uuid4())[:8]
@@ -58,83 +71,135 @@ def get_template_variables(project_name: str, target_dir: Path) -> Dict[str, str
     return variables
 
 
-def customize_file_content(content: str, variables: Dict[str, str]) -> str:
-    """Customize file content with template variables."""
+def compile_replacements(variables: Dict[str, str]) -> Tuple[Dict[str, str], Pattern[str]]:
+    """Map every placeholder to its replacement and compile one pattern matching them all."""
     
+    replacements = {}
     for key, value in variables.items():
-        # Replace template placeholders
-        content = content.replace(f"{{{{{key}}}}}", value)
-        content = content.replace(f"%%{key}%%", value)
-        
-        # Handle specific replacements
-        if key == "PROJECT_NAME":
-            # Update project names in various formats
-            content = content.replace("cognee-graphrag", value)
-            content = content.replace("Cognee GraphRAG", value.replace("-", " ").title())
-        
-        elif key == "PROJECT_NAME_UNDERSCORE":
-            # Update Python module names
-            content = content.replace("cognee_graphrag", value)
+        # Template placeholders
+        replacements[f"{{{{{key}}}}}"] = value
+        replacements[f"%%{key}%%"] = value
+    
+    # Update project names in various formats
+    project_name = variables["PROJECT_NAME"]
+    replacements["cognee-graphrag"] = project_name
+    replacements["Cognee GraphRAG"] = project_name.replace("-", " ").title()
+    
+    # Update Python module names
+    replacements["cognee_graphrag"] = variables["PROJECT_NAME_UNDERSCORE"]
+    
+    # Longest first, so the longest token wins where alternatives overlap
+    pattern = re.compile("|".join(
+        re.escape(token) for token in sorted(replacements, key=len, reverse=True)
+    ))
+    return replacements, pattern
+
+
+def customize_file_content(content: str, replacements: Dict[str, str], pattern: Pattern[str]) -> str:
+    """Customize file content with template variables in a single pass."""
+    
+    return pattern.sub(lambda match: replacements[match.group(0)], content)
+
+
+def should_skip(name: str) -> bool:
+    """Check if a file or directory name should be skipped."""
+    return name in SKIP_NAMES or name.endswith(SKIP_SUFFIXES)
+
+
+def _fast_copy(src_fd: int, dst_fd: int, size: int):
+    """Copy size bytes between file descriptors without moving them through Python."""
+    
+    copied = 0
     
-    return content
+    # copy_file_range (Linux 4.5+) can share blocks on copy-on-write filesystems
+    if hasattr(os, "copy_file_range"):
+        try:
+            while copied < size:
+                count = os.copy_file_range(src_fd, dst_fd, size - copied)
+                if not count:
+                    break
+                copied += count
+        except OSError:
+            pass
+    
+    # sendfile picks up whatever copy_file_range did not copy
+    while copied < size:
+        count = os.sendfile(dst_fd, src_fd, copied, size - copied)
+        if not count:
+            break
+        copied += count
 
 
 def copy_template(source_dir: Path, target_dir: Path, variables: Dict[str, str]):
     """Copy template files with customization."""
     
-    # Files to skip during copy
-    skip_files = {
-        "__pycache__",
-        ".git",
-        ".pytest_cache",
-        "*.pyc",
-        ".DS_Store",
-        "copy_template.py"  # Don't copy the template script itself
-    }
-    
     # Files that need content customization
     customize_extensions = {".py", ".md", ".toml", ".json", ".env", ".txt", ".yml", ".yaml"}
     
-    def should_skip(path: Path) -> bool:
-        """Check if path should be skipped."""
-        for skip_pattern in skip_files:
-            if skip_pattern in str(path):
-                return True
-        return False
+    # Compiled once and shared by every file
+    replacements, pattern = compile_replacements(variables)
+    byte_pattern = re.compile(pattern.pattern.encode('utf-8'))
     
-    def copy_file(src: Path, dst: Path):
-        """Copy a single file with optional customization."""
-        if should_skip(src):
-            return
-        
-        # Ensure destination directory exists
-        dst.parent.mkdir(parents=True, exist_ok=True)
+    def scan(dir_path: str):
+        """Yield the files under dir_path, pruning skipped directories."""
+        # DirEntry caches the type from the directory listing, so the checks
+        # below need no extra stat() per entry (unlike rglob + is_file)
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if should_skip(entry.name):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    yield from scan(entry.path)
+                elif entry.is_file():
+                    yield entry
+    
+    def copy_file(entry: os.DirEntry, rel_path: str) -> str:
+        """Copy a single file with optional customization, returning its progress lines."""
+        src = entry.path
+        dst = target_dir / rel_path
         
         # Check if file needs content customization
-        if src.suffix in customize_extensions:
+        if os.path.splitext(entry.name)[1] in customize_extensions:
             try:
-                content = src.read_text(encoding='utf-8')
-                customized_content = customize_file_content(content, variables)
-                dst.write_text(customized_content, encoding='utf-8')
-                print(f"   📝 Customized: {dst.relative_to(target_dir)}")
+                # One read and one write in binary mode; only files that
+                # contain a placeholder pay for the decode/encode round-trip
+                raw = Path(src).read_bytes()
+                if byte_pattern.search(raw) is None:
+                    dst.write_bytes(raw)
+                    return f"   📄 Copied: {rel_path}"
+                content = raw.decode('utf-8')
+                customized_content = customize_file_content(content, replacements, pattern)
+                dst.write_bytes(customized_content.encode('utf-8'))
+                return f"   📝 Customized: {rel_path}"
             except Exception as e:
-                print(f"   ⚠️  Error customizing {src}: {e}")
                 # Fall back to regular copy
                 shutil.copy2(src, dst)
-                print(f"   📄 Copied: {dst.relative_to(target_dir)}")
+                return f"   ⚠️  Error customizing {src}: {e}\n   📄 Copied: {rel_path}"
         else:
-            # Regular file copy
-            shutil.copy2(src, dst)
-            print(f"   📄 Copied: {dst.relative_to(target_dir)}")
-    
-    # Walk through source directory
-    for src_path in source_dir.rglob("*"):
-        if src_path.is_file() and not should_skip(src_path):
-            # Calculate relative path and destination
-            rel_path = src_path.relative_to(source_dir)
-            dst_path = target_dir / rel_path
-            
-            copy_file(src_path, dst_path)
+            # Regular file copy, done inside the kernel where the platform allows
+            try:
+                with open(src, 'rb') as src_file, open(dst, 'wb') as dst_file:
+                    _fast_copy(src_file.fileno(), dst_file.fileno(), entry.stat().st_size)
+                shutil.copystat(src, dst)
+            except (AttributeError, OSError):
+                shutil.copy2(src, dst)
+            return f"   📄 Copied: {rel_path}"
+    
+    # Walk through source directory; entry paths start with the source path,
+    # so slicing it off gives the relative path
+    prefix_len = len(str(source_dir)) + 1
+    files = [(entry, entry.path[prefix_len:]) for entry in scan(str(source_dir))]
+    
+    # Create each destination directory once, before the parallel copies
+    for parent in {(target_dir / rel_path).parent for _, rel_path in files}:
+        parent.mkdir(parents=True, exist_ok=True)
+    
+    # Files are independent and I/O bound, so copy them on a thread pool;
+    # map() yields results in walk order and only this thread prints
+    max_workers = min(8, (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for progress in executor.map(lambda file: copy_file(*file), files):
+            print(progress)
 
 
 def create_project_readme(target_dir: Path, variables: Dict[str, str]):
@@ -10,8 +10,11 @@ This example demonstrates:
 """
 
 import asyncio
+import io
+import re
+import time
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, TextIO
 import json
 
 # Add src to path for imports
@@ -22,28 +25,91 @@ sys.path.append(str(Path(__file__).parent.parent))
 from src.graphrag import GraphRAG, GraphRAGConfig
 
 
+# Simple entity extraction (in real implementation, use NER)
+_COMMON_ENTITIES = (
+    "machine learning", "artificial intelligence", "deep learning",
+    "google", "microsoft", "apple", "tesla", "openai",
+    "einstein", "marie curie", "geoffrey hinton", "andrew ng",
+    "quantum mechanics", "dna", "neural networks"
+)
+
+# Lowercased once, longest first: regex alternation takes the first branch that
+# matches, so "artificial intelligence" must be tried before any shorter prefix
+_COMMON_ENTITIES_SORTED = tuple(sorted({e.lower() for e in _COMMON_ENTITIES}, key=len, reverse=True))
+
+# One alternation over every entity: a single scan finds all of them
+_ENTITY_PATTERN = re.compile("|".join(map(re.escape, _COMMON_ENTITIES_SORTED)))
+
+# Search strategies compared by every analysis and benchmark
+_SEARCH_TYPES = ("vector", "graph", "combined")
+
+# Query categories exercised by demonstrate_query_patterns
+_QUERY_PATTERNS = {
+    "Entity-Focused Queries": [
+        "What do you know about Geoffrey Hinton and deep learning?",
+        "Tell me about Google and its founders",
+        "What are the contributions of Marie Curie to science?"
+    ],
+    
+    "Relationship Queries": [
+        "How are machine learning and neural networks related?",
+        "What is the connection between Einstein and quantum mechanics?",
+        "How do Tesla and autonomous vehicles relate?"
+    ],
+    
+    "Comparative Queries": [
+        "Compare Google and Microsoft as technology companies",
+        "What are the differences between classical and quantum physics?",
+        "How do different AI researchers approach machine learning?"
+    ],
+    
+    "Multi-Domain Queries": [  
+        "How do physics concepts relate to AI development?",
+        "What connections exist between technology companies and scientific research?",
+        "How has scientific discovery influenced modern technology?"
+    ]
+}
+
+# Queries per category analyzed at once, to stay within backend connection limits
+_QUERY_CONCURRENCY = 4
+
+# Queries timed by benchmark_search_performance
+_BENCHMARK_QUERIES = (
+    "machine learning algorithms",
+    "technology company leaders",
+    "scientific discoveries",
+    "artificial intelligence applications",
+    "quantum physics principles"
+)
+
+
 class QueryAnalyzer:
     """Analyze and rank query results."""
     
     @staticmethod
     def analyze_results(results: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze search results and provide insights."""
-        if results.get("status") != "success":
-            return {"error": results.get("error", "Unknown error")}
+        results_get = results.get
+        if results_get("status") != "success":
+            return {"error": results_get("error", "Unknown error")}
         
-        search_results = results.get("results", [])
+        search_results = results_get("results", [])
+        search_type = results_get("search_type", "unknown")
         analysis = {
             "total_results": len(search_results),
-            "search_type": results.get("search_type", "unknown"),
-            "query": results.get("query", ""),
+            "search_type": search_type,
+            "query": results_get("query", ""),
         }
         
-        if results.get("search_type") == "combined":
-            analysis["vector_count"] = results.get("vector_count", 0)
-            analysis["graph_count"] = results.get("graph_count", 0)
+        if search_type == "combined":
+            total = len(search_results) or 1
+            vector_count = results_get("vector_count", 0)
+            graph_count = results_get("graph_count", 0)
+            analysis["vector_count"] = vector_count
+            analysis["graph_count"] = graph_count
             analysis["coverage"] = {
-                "vector_ratio": analysis["vector_count"] / max(analysis["total_results"], 1),
-                "graph_ratio": analysis["graph_count"] / max(analysis["total_results"], 1)
+                "vector_ratio": vector_count / total,
+                "graph_ratio": graph_count / total
             }
         
         return analysis
@@ -51,50 +117,54 @@ class QueryAnalyzer:
     @staticmethod
     def extract_entities(results: List[Any]) -> List[str]:
         """Extract mentioned entities from results."""
-        entities = set()
-        for result in results:
-            result_str = str(result).lower()
-            # Simple entity extraction (in real implementation, use NER)
-            common_entities = [
-                "machine learning", "artificial intelligence", "deep learning",
-                "google", "microsoft", "apple", "tesla", "openai",
-                "einstein", "marie curie", "geoffrey hinton", "andrew ng",
-                "quantum mechanics", "dna", "neural networks"
-            ]
-            for entity in common_entities:
-                if entity in result_str:
-                    entities.add(entity)
-        return list(entities)
+        text = "\n".join(str(result).lower() for result in results)
+        return list(set(_ENTITY_PATTERN.findall(text)))
 
 
-async def run_query_analysis(graphrag: GraphRAG, query: str, search_types: List[str]):
-    """Run comprehensive query analysis."""
-    print(f"\n🔍 Analyzing Query: '{query}'")
-    print("-" * 60)
+async def run_query_analysis(
+    graphrag: GraphRAG, query: str, search_types: List[str], out: Optional[TextIO] = None
+):
+    """Run comprehensive query analysis, printing to out (stdout by default)."""
+    # Standalone calls buffer their report and write it to stdout in one go
+    buffered = out is None
+    if buffered:
+        out = io.StringIO()
+    
+    print(f"\n🔍 Analyzing Query: '{query}'", file=out)
+    print("-" * 60, file=out)
     
     analyzer = QueryAnalyzer()
     results_by_type = {}
     
-    # Run different search types
-    for search_type in search_types:
-        print(f"  Running {search_type} search...")
-        result = await graphrag.search(query, search_type=search_type, top_k=8)
+    # Run different search types concurrently; they hit independent backends
+    print(f"  Running {', '.join(search_types)} searches...", file=out)
+    results = await asyncio.gather(
+        *[graphrag.search(query, search_type=st, top_k=8) for st in search_types],
+        return_exceptions=True
+    )
+    
+    for search_type, result in zip(search_types, results):
+        if isinstance(result, Exception):
+            result = {"status": "error", "error": str(result), "search_type": search_type}
         results_by_type[search_type] = result
         
         # Analyze results
         analysis = analyzer.analyze_results(result)
-        print(f"    📊 {search_type.title()} Results: {analysis.get('total_results', 0)}")
+        print(f"    📊 {search_type.title()} Results: {analysis.get('total_results', 0)}", file=out)
         
         if search_type == "combined" and analysis.get("coverage"):
             coverage = analysis["coverage"]
-            print(f"    📈 Vector: {coverage['vector_ratio']:.1%}, Graph: {coverage['graph_ratio']:.1%}")
+            print(f"    📈 Vector: {coverage['vector_ratio']:.1%}, Graph: {coverage['graph_ratio']:.1%}", file=out)
     
     # Compare results across search types
-    print("\n  🔄 Cross-Search Analysis:")
+    print("\n  🔄 Cross-Search Analysis:", file=out)
     for search_type, result in results_by_type.items():
         if result.get("status") == "success":
             entities = analyzer.extract_entities(result.get("results", []))
-            print(f"    {search_type.title()}: {len(entities)} entities - {', '.join(entities[:3])}{'...' if len(entities) > 3 else ''}")
+            print(f"    {search_type.title()}: {len(entities)} entities - {', '.join(entities[:3])}{'...' if len(entities) > 3 else ''}", file=out)
+    
+    if buffered:
+        sys.stdout.write(out.getvalue())
     
     return results_by_type
 
@@ -102,43 +172,23 @@ async def run_query_analysis(graphrag: GraphRAG, query: str, search_types: List[
 async def demonstrate_query_patterns(graphrag: GraphRAG):
     """Demonstrate various GraphRAG query patterns."""
     
-    query_patterns = {
-        "Entity-Focused Queries": [
-            "What do you know about Geoffrey Hinton and deep learning?",
-            "Tell me about Google and its founders",
-            "What are the contributions of Marie Curie to science?"
-        ],
-        
-        "Relationship Queries": [
-            "How are machine learning and neural networks related?",
-            "What is the connection between Einstein and quantum mechanics?",
-            "How do Tesla and autonomous vehicles relate?"
-        ],
-        
-        "Comparative Queries": [
-            "Compare Google and Microsoft as technology companies",
-            "What are the differences between classical and quantum physics?",
-            "How do different AI researchers approach machine learning?"
-        ],
-        
-        "Multi-Domain Queries": [  
-            "How do physics concepts relate to AI development?",
-            "What connections exist between technology companies and scientific research?",
-            "How has scientific discovery influenced modern technology?"
-        ]
-    }
+    # Queries within a category run concurrently; each buffers its output so
+    # it prints in order rather than interleaved
+    sem = asyncio.Semaphore(_QUERY_CONCURRENCY)
     
-    # Test different search strategies
-    search_strategies = ["vector", "graph", "combined"]
+    async def limited(query: str, buf: io.StringIO):
+        async with sem:
+            return await run_query_analysis(graphrag, query, _SEARCH_TYPES, out=buf)
     
-    for category, queries in query_patterns.items():
+    for category, queries in _QUERY_PATTERNS.items():
         print(f"\n{'='*20} {category} {'='*20}")
         
-        for query in queries:
-            await run_query_analysis(graphrag, query, search_strategies)
-            
-            # Add some spacing
-            print()
+        buffers = [io.StringIO() for _ in queries]
+        await asyncio.gather(*(limited(q, buf) for q, buf in zip(queries, buffers)))
+        
+        for buf in buffers:
+            # print's own newline adds some spacing
+            print(buf.getvalue())
 
 
 async def benchmark_search_performance(graphrag: GraphRAG):
@@ -146,51 +196,38 @@ async def benchmark_search_performance(graphrag: GraphRAG):
     print("\n🏃 Search Performance Benchmarking")
     print("=" * 50)
     
-    benchmark_queries = [
-        "machine learning algorithms",
-        "technology company leaders", 
-        "scientific discoveries",
-        "artificial intelligence applications",
-        "quantum physics principles"
-    ]
+    # Warm up each search type once so index loading isn't billed to the first query
+    for search_type in _SEARCH_TYPES:
+        await graphrag.search(_BENCHMARK_QUERIES[0], search_type=search_type, top_k=5)
     
-    import time
+    # Running totals per search type, accumulated as each search is timed
+    sums = dict.fromkeys(_SEARCH_TYPES, 0.0)
+    counts = dict.fromkeys(_SEARCH_TYPES, 0)
     
-    performance_results = []
-    
-    for query in benchmark_queries:
-        print(f"\n⏱️  Benchmarking: '{query}'")
-        
-        search_times = {}
+    for query in _BENCHMARK_QUERIES:
+        # Collect each query's lines and write them once, outside the timed region
+        out = io.StringIO()
+        print(f"\n⏱️  Benchmarking: '{query}'", file=out)
         
-        for search_type in ["vector", "graph", "combined"]:
-            start_time = time.time()
+        for search_type in _SEARCH_TYPES:
+            start = time.perf_counter_ns()
             result = await graphrag.search(query, search_type=search_type, top_k=5)
-            end_time = time.time()
+            elapsed_ns = time.perf_counter_ns() - start
             
-            search_time = end_time - start_time
-            search_times[search_type] = search_time
+            search_time = elapsed_ns / 1e9
+            sums[search_type] += search_time
+            counts[search_type] += 1
             result_count = len(result.get("results", []))
             
-            print(f"  {search_type.title()}: {search_time:.3f}s ({result_count} results)")
+            print(f"  {search_type.title()}: {search_time:.3f}s ({result_count} results)", file=out)
         
-        performance_results.append({
-            "query": query,
-            "times": search_times,
-            "fastest": min(search_times.values()),
-            "slowest": max(search_times.values())
-        })
+        sys.stdout.write(out.getvalue())
     
     # Performance summary
     print(f"\n📊 Performance Summary:")
-    avg_times = {"vector": 0, "graph": 0, "combined": 0}
-    
-    for result in performance_results:
-        for search_type, time_taken in result["times"].items():
-            avg_times[search_type] += time_taken
+    avg_times = {k: sums[k] / counts[k] for k in sums}
     
     for search_type in avg_times:
-        avg_times[search_type] /= len(performance_results)
         print(f"  {search_type.title()} average: {avg_times[search_type]:.3f}s")
     
     fastest_method = min(avg_times.keys(), key=lambda k: avg_times[k])
@@ -252,12 +289,12 @@ async def main():
     
     print(f"\n🧠 Multi-Step Reasoning: '{reasoning_query}'")
     
-    # Step 1: Find AI researchers
-    ai_researchers = await graphrag.search("Geoffrey Hinton AI researchers", search_type="graph", top_k=5)
+    # Steps 1 and 2: find AI researchers and technology companies (independent probes)
+    ai_researchers, tech_companies = await asyncio.gather(
+        graphrag.search("Geoffrey Hinton AI researchers", search_type="graph", top_k=5),
+        graphrag.search("Google technology companies", search_type="vector", top_k=5)
+    )
     print(f"  Step 1 - AI Researchers: {len(ai_researchers.get('results', []))} found")
-    
-    # Step 2: Find technology companies
-    tech_companies = await graphrag.search("Google technology companies", search_type="vector", top_k=5)
     print(f"  Step 2 - Tech Companies: {len(tech_companies.get('results', []))} found")
     
     # Step 3: Combined reasoning
@@ -0,0 +1,166 @@
+"""Tests for LanceDB table creation and writes."""
+
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("lancedb")
+pytest.importorskip("lance")
+pa = pytest.importorskip("pyarrow")
+
+from config.lancedb import LanceDBConfig
+
+DIM = 16
+
+
+def _rows(count, start=0):
+    """Rows matching the sample table schema."""
+    return [
+        {
+            "id": str(i),
+            "text": f"document {i}",
+            "embedding": [0.1] * DIM,
+            "metadata": "{}",
+            "timestamp": datetime(2024, 1, 1),
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def _count(config, table_name="documents"):
+    """Row count as seen through a freshly opened table."""
+    return config.connection.open_table(table_name).count_rows()
+
+
+@pytest.fixture
+def lancedb_config(tmp_path):
+    """LanceDB config backed by a throwaway directory."""
+    return LanceDBConfig(path=str(tmp_path / "lancedb"), table_name="documents", embedding_dim=DIM)
+
+
+def test_sample_table_uses_configured_storage_version(lancedb_config):
+    lancedb_config.create_sample_table()
+    
+    table = lancedb_config.connection.open_table("documents")
+    assert table.to_lance().data_storage_version == lancedb_config.data_storage_version
+
+
+def test_cleared_table_keeps_configured_storage_version(lancedb_config):
+    lancedb_config.create_sample_table()
+    lancedb_config.connection.create_table(
+        "extra",
+        schema=lancedb_config._table("documents").schema,
+        data_storage_version=lancedb_config.data_storage_version,
+    )
+    lancedb_config._invalidate()
+    lancedb_config.clear_table("extra")
+    
+    table = lancedb_config.connection.open_table("extra")
+    assert table.to_lance().data_storage_version == lancedb_config.data_storage_version
+
+
+def test_batch_add_writes_full_batches_and_flush_writes_the_rest(lancedb_config):
+    lancedb_config.create_sample_table()
+    
+    lancedb_config.batch_add(_rows(600), batch_size=1000)
+    assert _count(lancedb_config) == 0
+    
+    lancedb_config.batch_add(_rows(600, start=600), batch_size=1000)
+    assert _count(lancedb_config) == 1200
+    
+    lancedb_config.batch_add(_rows(10, start=1200), batch_size=1000)
+    lancedb_config.flush_batches()
+    assert _count(lancedb_config) == 1210
+
+
+def test_failed_flush_discards_its_rows(lancedb_config, monkeypatch):
+    lancedb_config.create_sample_table()
+    table = lancedb_config._table("documents")
+    
+    def fail(data, *args, **kwargs):
+        raise OSError("disk full")
+    
+    monkeypatch.setattr(table, "add", fail)
+    with pytest.raises(OSError):
+        lancedb_config.batch_add(_rows(1000), batch_size=1000)
+    assert lancedb_config._buffer == []
+    assert lancedb_config._buffered_rows == 0
+    
+    # Later writes are not held up by the failed rows
+    monkeypatch.undo()
+    lancedb_config.batch_add(_rows(1000, start=1000), batch_size=1000)
+    assert _count(lancedb_config) == 1000
+
+
+def test_bulk_ingest_appends_every_batch(lancedb_config):
+    lancedb_config.create_sample_table()
+    schema = lancedb_config._table("documents").schema
+    batches = [pa.RecordBatch.from_pylist(_rows(250, start=i * 250), schema=schema) for i in range(4)]
+    
+    assert lancedb_config.bulk_ingest(batches, batch_rows=300) == 1000
+    assert _count(lancedb_config) == 1000
+
+
+def test_cached_table_sees_writes_from_other_connections(lancedb_config):
+    import lancedb
+    
+    lancedb_config.create_sample_table()
+    assert lancedb_config._table("documents").count_rows() == 0
+    
+    lancedb.connect(lancedb_config.path).open_table("documents").add(_rows(10))
+    
+    assert lancedb_config._table("documents").count_rows() == 10
+    assert lancedb_config.get_table_info()["count"] == 10
+
+
+def test_add_rows_accepts_sub_second_timestamps(lancedb_config):
+    import numpy as np
+    
+    lancedb_config.create_sample_table()
+    timestamps = np.array(
+        ["2024-01-01T00:00:00.250", "2024-01-01T00:00:01.500", "2024-01-01T00:00:02.999"],
+        dtype="datetime64[ns]",
+    )
+    
+    lancedb_config.add_rows(
+        ids=["a", "b", "c"],
+        texts=["one", "two", "three"],
+        embeddings=np.ones((3, DIM), dtype=np.float32),
+        metadata=["{}"] * 3,
+        timestamps=timestamps,
+    )
+    
+    table = lancedb_config.connection.open_table("documents")
+    assert table.count_rows() == 3
+    stored = sorted(table.to_arrow().column("timestamp").to_pylist())
+    assert stored == [datetime(2024, 1, 1, 0, 0, second) for second in range(3)]
+
+
+def test_int8_quantization_is_refused(tmp_path):
+    with pytest.raises(ValueError, match="int8"):
+        LanceDBConfig(path=str(tmp_path), embedding_dim=DIM, embedding_quantization="int8")
+
+
+@pytest.mark.parametrize("quantization", ["fp32", "binary"])
+def test_ensure_vector_index_builds_an_index(tmp_path, quantization):
+    import numpy as np
+    
+    config = LanceDBConfig(
+        path=str(tmp_path / "lancedb"),
+        table_name="documents",
+        embedding_dim=DIM,
+        embedding_quantization=quantization,
+    )
+    config.create_sample_table()
+    rows = 6000
+    config.add_rows(
+        ids=[str(i) for i in range(rows)],
+        texts=["text"] * rows,
+        embeddings=np.random.default_rng(0).standard_normal((rows, DIM)).astype(np.float32),
+        metadata=["{}"] * rows,
+        timestamps=np.full(rows, np.datetime64("2024-01-01T00:00:00", "s")),
+    )
+    
+    assert config.ensure_vector_index() is True
+    indices = config.connection.open_table("documents").list_indices()
+    assert any("embedding" in index.columns for index in indices)
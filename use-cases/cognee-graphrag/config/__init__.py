@@ -1,5 +1,8 @@
 """Configuration helpers for Cognee MCP server setup."""
 
+import asyncio
+from typing import Any, Dict
+
 from .mcp_env_setup import (
     create_mcp_env_file,
     create_claude_settings,
@@ -28,6 +31,7 @@ __all__ = [
     'get_neo4j_config',
     'get_lancedb_config',
     'get_sqlite_config',
+    'test_all_connections_async',
 ]
 
 
@@ -49,4 +53,32 @@ def setup_mcp_environment(cognee_mcp_path, api_key, **kwargs):
         'settings_file': settings_path,
         'validation': validation_results,
         'setup_complete': all(validation_results.values())
-    }
\ No newline at end of file
+    }
+
+
+async def test_all_connections_async(databases: Dict[str, Any]) -> Dict[str, bool]:
+    """Test database connections in parallel, stopping at the first failure."""
+    loop = asyncio.get_running_loop()
+    pending = {
+        loop.run_in_executor(None, db.test_connection): name
+        for name, db in databases.items()
+    }
+    results = {}
+    
+    while pending:
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for future in done:
+            name = pending.pop(future)
+            try:
+                results[name] = bool(future.result())
+            except Exception as e:
+                print(f"{name} connection test failed: {e}")
+                results[name] = False
+        
+        if not all(results.values()):
+            # Fail fast: the remaining probes can no longer change the outcome
+            for future in pending:
+                future.cancel()
+            break
+    
+    return results
@@ -1,13 +1,42 @@
 """LanceDB configuration and connection management for GraphRAG."""
 
+import logging
+import math
 import os
-from typing import Optional, Dict, Any, List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 from pathlib import Path
 import lancedb
+import numpy as np
+import pyarrow as pa
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Per-field Lance encoding: LZ4 keeps large text and vector columns compact on disk
+LZ4_COMPRESSION = {b"lance-encoding:compression": b"lz4"}
+
+# Embedding storage: fp32 as-is, binary as packed sign bits. int8 is not offered:
+# Lance cannot build an ANN index on int8 vectors, so such tables would never be indexed
+EMBEDDING_QUANTIZATIONS = ("fp32", "binary")
+
+# Below this many rows a brute-force scan is as fast as an ANN index
+VECTOR_INDEX_MIN_ROWS = 5000
+
+# Index deltas merged when batch writes compact a table
+COMPACTION_INDICES_TO_MERGE = 20
+
+# How long a table_names() listing is reused before hitting storage again
+TABLE_NAMES_TTL = 2.0
+
+# test_connection reuses its result this long, and gives up on a hung store after the timeout
+CONNECTION_TEST_TTL = 30.0
+CONNECTION_TEST_TIMEOUT = 2.0
+
 
 class LanceDBConfig:
     """LanceDB configuration and connection management."""
@@ -16,31 +45,97 @@ class LanceDBConfig:
         self,
         path: Optional[str] = None,
         table_name: Optional[str] = None,
+        embedding_dim: Optional[int] = None,
+        embedding_quantization: Optional[str] = None,
     ):
         self.path = path or os.getenv("LANCEDB_PATH", "./lancedb_data")
         self.table_name = table_name or os.getenv("LANCEDB_TABLE_NAME", "documents")
+        self.embedding_dim = embedding_dim or int(os.getenv("LANCEDB_EMBEDDING_DIM", "768"))
+        self.embedding_quantization = (
+            embedding_quantization or os.getenv("LANCEDB_EMBEDDING_QUANTIZATION", "fp32")
+        )
+        if self.embedding_quantization == "int8":
+            raise ValueError(
+                "int8 embedding quantization is not supported: Lance cannot build a "
+                "vector index on int8 vectors; use 'fp32' or 'binary'"
+            )
+        if self.embedding_quantization not in EMBEDDING_QUANTIZATIONS:
+            raise ValueError(
+                f"Unknown embedding quantization {self.embedding_quantization!r}; "
+                f"expected one of {', '.join(EMBEDDING_QUANTIZATIONS)}"
+            )
+        self.data_storage_version = os.getenv("LANCEDB_DATA_STORAGE_VERSION", "2.2")
         self._connection = None
         
-        # Ensure directory exists
-        Path(self.path).mkdir(parents=True, exist_ok=True)
+        # Metadata caches: table listing on a short TTL, opened table handles by name
+        self._names_cache: Tuple[float, List[str]] = (0.0, [])
+        self._table_cache: Dict[str, Any] = {}
+        self._test_cache: Optional[Tuple[float, bool]] = None
+        
+        # Write buffer for batch_add: rows are appended in large batches
+        self._buffer: List[pa.RecordBatch] = []
+        self._buffered_rows = 0
+        self._buffer_table: Optional[str] = None
+        self._flush_count = 0
+        self._optimize_every = 10
     
     @property
     def connection(self):
-        """Get or create LanceDB connection."""
+        """Get or create LanceDB connection, creating the data directory on first use."""
         if self._connection is None:
+            Path(self.path).mkdir(parents=True, exist_ok=True)
             self._connection = lancedb.connect(self.path)
         return self._connection
     
+    def _names(self) -> List[str]:
+        """Return table names, reusing the listing for a short TTL."""
+        now = time.monotonic()
+        if now - self._names_cache[0] > TABLE_NAMES_TTL:
+            self._names_cache = (now, self.connection.table_names())
+        return self._names_cache[1]
+    
+    def _table(self, table_name: str):
+        """Return an opened table handle at its latest version, opening each table once."""
+        table = self._table_cache.get(table_name)
+        if table is None:
+            table = self._table_cache[table_name] = self.connection.open_table(table_name)
+        else:
+            # A cached handle stays on the version it opened; pick up writes
+            # made through other connections (e.g. Cognee's) on every lookup
+            table.checkout_latest()
+        return table
+    
+    def _invalidate(self, table_name: Optional[str] = None) -> None:
+        """Forget cached metadata after a table is created or dropped."""
+        self._names_cache = (0.0, [])
+        if table_name is None:
+            self._table_cache.clear()
+        else:
+            self._table_cache.pop(table_name, None)
+    
     def test_connection(self) -> bool:
-        """Test the LanceDB connection."""
+        """Test the LanceDB connection, reusing a result younger than the TTL."""
+        now = time.monotonic()
+        if self._test_cache is not None and now - self._test_cache[0] < CONNECTION_TEST_TTL:
+            return self._test_cache[1]
+        
+        executor = ThreadPoolExecutor(max_workers=1)
         try:
-            # Try to list tables
-            tables = self.connection.table_names()
-            print(f"LanceDB connection successful. Found {len(tables)} tables.")
-            return True
+            # Try to list tables, bounded so a hung store can't block startup
+            tables = executor.submit(lambda: self.connection.table_names()).result(
+                timeout=CONNECTION_TEST_TIMEOUT
+            )
+            self._names_cache = (time.monotonic(), tables)
+            logger.info(f"LanceDB connection successful. Found {len(tables)} tables.")
+            success = True
         except Exception as e:
-            print(f"LanceDB connection test failed: {e}")
-            return False
+            logger.warning(f"LanceDB connection test failed: {e!r}")
+            success = False
+        finally:
+            executor.shutdown(wait=False)
+        
+        self._test_cache = (now, success)
+        return success
     
     def get_config_dict(self) -> Dict[str, Any]:
         """Get configuration dictionary for Cognee."""
@@ -48,12 +143,15 @@ class LanceDBConfig:
             "vector_db_provider": "lancedb",
             "lancedb_path": self.path,
             "lancedb_table_name": self.table_name,
+            "lancedb_data_storage_version": self.data_storage_version,
+            "lancedb_embedding_dim": self.embedding_dim,
+            "lancedb_embedding_quantization": self.embedding_quantization,
         }
     
     def list_tables(self) -> List[str]:
         """List all tables in LanceDB."""
         try:
-            return self.connection.table_names()
+            return list(self._names())
         except Exception as e:
             print(f"Error listing tables: {e}")
             return []
@@ -62,8 +160,8 @@ class LanceDBConfig:
         """Get information about a specific table."""
         table_name = table_name or self.table_name
         try:
-            if table_name in self.connection.table_names():
-                table = self.connection.open_table(table_name)
+            if table_name in self._names():
+                table = self._table(table_name)
                 return {
                     "name": table_name,
                     "schema": table.schema,
@@ -75,38 +173,286 @@ class LanceDBConfig:
         except Exception as e:
             return {"error": f"Error getting table info: {e}"}
     
+    def embedding_type(self) -> pa.DataType:
+        """Arrow type of the embedding column for the configured quantization."""
+        if self.embedding_quantization == "binary":
+            return pa.list_(pa.uint8(), (self.embedding_dim + 7) // 8)
+        return pa.list_(pa.float32(), self.embedding_dim)
+    
+    def quantize(self, embeddings: np.ndarray) -> np.ndarray:
+        """Convert float embeddings to the configured storage representation."""
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if self.embedding_quantization == "binary":
+            return np.packbits(embeddings > 0, axis=1)
+        return embeddings
+    
     def create_sample_table(self) -> None:
         """Create a sample table for testing."""
         try:
-            import pyarrow as pa
-            
             # Sample data schema for document embeddings
             schema = pa.schema([
                 pa.field("id", pa.string()),
-                pa.field("text", pa.string()),
-                pa.field("embedding", pa.list_(pa.float32())),
+                pa.field("text", pa.string(), metadata=LZ4_COMPRESSION),
+                # Fixed-size list: contiguous vectors with no per-row offsets
+                pa.field("embedding", self.embedding_type(), metadata=LZ4_COMPRESSION),
                 pa.field("metadata", pa.string()),
                 pa.field("timestamp", pa.timestamp("s")),
             ])
             
             # Create empty table with schema
-            self.connection.create_table(
+            self._invalidate(self.table_name)
+            self._table_cache[self.table_name] = self.connection.create_table(
                 self.table_name,
                 schema=schema,
-                mode="overwrite"
+                mode="overwrite",
+                data_storage_version=self.data_storage_version,
             )
             print(f"✅ Created sample table: {self.table_name}")
             
         except Exception as e:
             print(f"❌ Error creating sample table: {e}")
     
+    def batch_add(
+        self,
+        rows: List[Dict[str, Any]],
+        table_name: Optional[str] = None,
+        batch_size: int = 1000,
+        optimize_every: int = 10,
+    ) -> None:
+        """Buffer rows and append them to a table in batches of ``batch_size``.
+        
+        Each flush writes one fragment instead of one per call and brings
+        the ANN index up to date without merging deltas; every
+        ``optimize_every`` flushes the table is compacted instead. Call
+        ``flush_batches`` once done to write the remainder and compact.
+        A failed write raises, and the rows buffered for it are discarded.
+        """
+        table_name = table_name or self.table_name
+        try:
+            if self._buffer and table_name != self._buffer_table:
+                self.flush_batches()
+            
+            table = self._table(table_name)
+            self._buffer.append(pa.RecordBatch.from_pylist(rows, schema=table.schema))
+            self._buffered_rows += len(rows)
+            self._buffer_table = table_name
+            self._optimize_every = optimize_every
+            
+            if self._buffered_rows >= batch_size:
+                self._flush_buffer(table)
+        except Exception as e:
+            print(f"❌ Error adding rows to {table_name}: {e}")
+            raise
+    
+    def add_rows(
+        self,
+        ids: List[str],
+        texts: List[str],
+        embeddings: np.ndarray,
+        metadata: List[str],
+        timestamps: np.ndarray,
+        table_name: Optional[str] = None,
+    ) -> None:
+        """Append rows supplied as columns, building Arrow arrays without per-row inference.
+        
+        ``embeddings`` is a 2-D (rows, dim) float array, quantized to the
+        configured representation, and ``timestamps`` a datetime64 array of
+        any unit, truncated to the table's timestamp unit; both are handed
+        to Arrow as contiguous buffers. Raises if the rows cannot be written.
+        """
+        table_name = table_name or self.table_name
+        try:
+            table = self._table(table_name)
+            embeddings = np.ascontiguousarray(self.quantize(embeddings))
+            embedding_arr = pa.FixedSizeListArray.from_arrays(
+                pa.array(embeddings.ravel()), embeddings.shape[1]
+            )
+            data = pa.table({
+                "id": pa.array(ids, type=pa.string()),
+                "text": pa.array(texts, type=pa.string()),
+                "embedding": embedding_arr,
+                "metadata": pa.array(metadata, type=pa.string()),
+                # numpy keeps its own unit (often ns); sub-second values would
+                # make the schema cast fail as lossy, so truncate explicitly
+                "timestamp": pa.array(timestamps).cast(
+                    table.schema.field("timestamp").type, safe=False
+                ),
+            })
+            table.add(data.cast(table.schema))
+        except Exception as e:
+            print(f"❌ Error adding rows to {table_name}: {e}")
+            raise
+    
+    def bulk_ingest(
+        self,
+        batches: Iterable[pa.RecordBatch],
+        table_name: Optional[str] = None,
+        batch_rows: int = 100_000,
+    ) -> int:
+        """Stream record batches into a table for an initial load.
+        
+        Batches are appended in chunks of ``batch_rows`` and compaction and
+        indexing are deferred to the end. Use only during initial load:
+        vector search returns partial results until the final optimize.
+        """
+        table_name = table_name or self.table_name
+        total = 0
+        try:
+            table = self._table(table_name)
+            pending: List[pa.RecordBatch] = []
+            pending_rows = 0
+            
+            for batch in batches:
+                pending.append(batch)
+                pending_rows += batch.num_rows
+                if pending_rows >= batch_rows:
+                    table.add(pa.Table.from_batches(pending), mode="append")
+                    total += pending_rows
+                    pending, pending_rows = [], 0
+            
+            if pending:
+                table.add(pa.Table.from_batches(pending), mode="append")
+                total += pending_rows
+            
+            table.optimize()
+            print(f"✅ Bulk ingested {total} rows into {table_name}")
+        except Exception as e:
+            print(f"❌ Error bulk ingesting into {table_name}: {e}")
+            return total
+        
+        self.ensure_vector_index(table_name)
+        return total
+    
+    def flush_batches(self) -> None:
+        """Write any buffered rows and run the deferred compaction."""
+        if self._buffer_table is None:
+            return
+        try:
+            table = self._table(self._buffer_table)
+            self._flush_buffer(table, optimize=False)
+            self._compact(table)
+            print(f"✅ Flushed and optimized table: {self._buffer_table}")
+            self.ensure_vector_index(self._buffer_table)
+        except Exception as e:
+            print(f"❌ Error flushing table: {e}")
+            raise
+        finally:
+            # Never carry unwritten rows over to the next table's buffer
+            self._buffer.clear()
+            self._buffered_rows = 0
+            self._buffer_table = None
+            self._flush_count = 0
+    
+    def _flush_buffer(self, table, optimize: bool = True) -> None:
+        """Append buffered record batches in a single write."""
+        if not self._buffer:
+            return
+        
+        try:
+            table.add(pa.Table.from_batches(self._buffer))
+        finally:
+            # Never retry a failed write: the same rows would fail every later flush
+            self._buffer.clear()
+            self._buffered_rows = 0
+        self._flush_count += 1
+        
+        if not optimize:
+            return
+        if self._flush_count % self._optimize_every == 0:
+            self._compact(table)
+        else:
+            self._optimize_indices(table, num_indices_to_merge=0)
+    
+    def _compact(self, table) -> None:
+        """Compact a table's fragments and merge its accumulated index deltas."""
+        table.optimize()
+        self._optimize_indices(table, num_indices_to_merge=COMPACTION_INDICES_TO_MERGE)
+    
+    @staticmethod
+    def _optimize_indices(table, num_indices_to_merge: int) -> None:
+        """Index rows appended since the last index update, merging up to N index deltas."""
+        if table.list_indices():
+            table.to_lance().optimize.optimize_indices(num_indices_to_merge=num_indices_to_merge)
+    
+    def ensure_vector_index(
+        self,
+        table_name: Optional[str] = None,
+        column: str = "embedding",
+        num_partitions: Optional[int] = None,
+        num_sub_vectors: Optional[int] = None,
+    ) -> bool:
+        """Create an ANN index on a vector column once the table is large enough.
+        
+        Float vectors get a cosine IVF_PQ index; bit-packed binary vectors
+        get a Hamming IVF_FLAT index, as PQ does not apply to bits. Raises if
+        the index cannot be built, unless a concurrent run just built it.
+        """
+        table_name = table_name or self.table_name
+        try:
+            table = self._table(table_name)
+            if any(column in index.columns for index in table.list_indices()):
+                return True
+            
+            rows = table.count_rows()
+            if rows <= VECTOR_INDEX_MIN_ROWS:
+                return False
+            
+            field_type = table.schema.field(column).type
+            if pa.types.is_fixed_size_list(field_type):
+                dim = field_type.list_size
+            else:
+                dim = len(table.head(1).column(column)[0])
+            num_partitions = num_partitions or int(math.sqrt(rows))
+            
+            if pa.types.is_uint8(field_type.value_type):
+                index_type = "IVF_FLAT"
+                table.create_index(
+                    metric="hamming",
+                    vector_column_name=column,
+                    num_partitions=num_partitions,
+                    index_type=index_type,
+                )
+            else:
+                index_type = "IVF_PQ"
+                table.create_index(
+                    metric="cosine",
+                    vector_column_name=column,
+                    num_partitions=num_partitions,
+                    num_sub_vectors=num_sub_vectors or max(1, dim // 8),
+                    index_type=index_type,
+                )
+            print(f"✅ Created {index_type} index on {table_name}.{column}")
+            return True
+        except Exception as e:
+            # Concurrent runs may race to create the same index; only that is benign
+            try:
+                if any(column in index.columns for index in self._table(table_name).list_indices()):
+                    return True
+            except Exception:
+                pass
+            print(f"❌ Could not create vector index on {table_name}.{column}: {e}")
+            raise
+    
     def clear_table(self, table_name: Optional[str] = None) -> None:
         """Clear all data from a specific table."""
         table_name = table_name or self.table_name
         try:
-            if table_name in self.connection.table_names():
-                table = self.connection.open_table(table_name)
-                table.delete("true")  # Delete all rows
+            if table_name in self._names():
+                # Drop and recreate rather than tombstoning every row, so the
+                # old fragments are reclaimed immediately
+                if table_name == self.table_name:
+                    self.connection.drop_table(table_name, ignore_missing=True)
+                    self._invalidate(table_name)
+                    self.create_sample_table()
+                else:
+                    schema = self._table(table_name).schema
+                    self.connection.drop_table(table_name, ignore_missing=True)
+                    self._invalidate(table_name)
+                    self._table_cache[table_name] = self.connection.create_table(
+                        table_name,
+                        schema=schema,
+                        data_storage_version=self.data_storage_version,
+                    )
                 print(f"✅ Cleared table: {table_name}")
             else:
                 print(f"⚠️  Table {table_name} not found")
@@ -117,8 +463,10 @@ class LanceDBConfig:
         """Clear all tables in LanceDB."""
         try:
             tables = self.list_tables()
-            for table_name in tables:
-                self.clear_table(table_name)
+            if tables:
+                # Tables are independent and Lance releases the GIL during I/O
+                with ThreadPoolExecutor(max_workers=min(8, len(tables))) as executor:
+                    list(executor.map(self.clear_table, tables))
             print("✅ LanceDB database cleared")
         except Exception as e:
             print(f"❌ Error clearing database: {e}")
@@ -127,8 +475,8 @@ class LanceDBConfig:
         """Optimize table for better performance."""
         table_name = table_name or self.table_name
         try:
-            if table_name in self.connection.table_names():
-                table = self.connection.open_table(table_name)
+            if table_name in self._names():
+                table = self._table(table_name)
                 table.optimize()
                 print(f"✅ Optimized table: {table_name}")
             else:
@@ -137,9 +485,20 @@ class LanceDBConfig:
             print(f"❌ Error optimizing table: {e}")
 
 
-def get_lancedb_config() -> LanceDBConfig:
-    """Get configured LanceDB instance."""
-    return LanceDBConfig()
+def get_lancedb_config(
+    path: Optional[str] = None,
+    table_name: Optional[str] = None,
+) -> LanceDBConfig:
+    """Get configured LanceDB instance, shared per (path, table_name)."""
+    path = path or os.getenv("LANCEDB_PATH", "./lancedb_data")
+    table_name = table_name or os.getenv("LANCEDB_TABLE_NAME", "documents")
+    return _cached_lancedb_config(path, table_name)
+
+
+@lru_cache(maxsize=8)
+def _cached_lancedb_config(path: str, table_name: str) -> LanceDBConfig:
+    """Build one LanceDBConfig, and so one lazy connection, per store."""
+    return LanceDBConfig(path=path, table_name=table_name)
 
 
 def setup_cognee_lancedb():
@@ -156,6 +515,8 @@ def setup_cognee_lancedb():
         # Create sample table if it doesn't exist
         if config.table_name not in config.list_tables():
             config.create_sample_table()
+        else:
+            config.ensure_vector_index()
     else:
         print("❌ LanceDB connection failed")
         
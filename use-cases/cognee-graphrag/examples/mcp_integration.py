@@ -10,11 +10,15 @@ This example demonstrates:
 """
 
 import asyncio
+import contextlib
+import io
 import json
+import os
 import subprocess
 import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional, TextIO, Tuple
 import time
 
 # Add src to path for imports
@@ -22,35 +26,201 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 sys.path.append(str(Path(__file__).parent.parent))
 
+try:
+    import orjson
+except ImportError:  # optional: pip install cognee-graphrag[fast]
+    orjson = None
+
+
+def _dumps_bytes(obj: Any) -> bytes:
+    """Pretty-print obj as JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+# Indent displayed JSON only for a terminal; set MCP_PRETTY=1 to force it
+# when output is redirected (e.g. while debugging CI logs)
+_PRETTY = sys.stdout.isatty() or os.getenv("MCP_PRETTY") == "1"
+
+
+def _dumps(obj: Any) -> str:
+    """Format obj as a JSON string for display, compact unless _PRETTY."""
+    if _PRETTY:
+        return _dumps_bytes(obj).decode()
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _freeze(value: Any) -> Any:
+    """Convert nested tool parameters into a hashable cache key."""
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
+@lru_cache(maxsize=1)
+def _cognee_mcp_path() -> Optional[Path]:
+    """Locate the cognee-mcp checkout, probing the candidate paths once per process."""
+    current_dir = Path(__file__).parent.parent
+    possible_paths = (
+        current_dir / "cognee" / "cognee-mcp",
+        current_dir.parent / "cognee" / "cognee-mcp",
+        Path.home() / "cognee" / "cognee-mcp",
+    )
+    return next((path for path in possible_paths if path.is_dir()), None)
+
+
+# Canned Cognee MCP tool responses, built once. The simulator returns shallow
+# copies with any per-call fields filled in; nested values are shared, so
+# callers must not mutate them.
+_COGNIFY_TEMPLATE = {
+    "status": "success",
+    "message": "",
+    "entities_extracted": 25,
+    "relationships_found": 18,
+    "processing_time": "2.3s"
+}
+
+_LIST_DATA_RESPONSE = {
+    "status": "success",
+    "datasets": [
+        {"name": "ai_research.txt", "size": "2.1KB", "processed": True},
+        {"name": "tech_companies.txt", "size": "1.8KB", "processed": True},
+        {"name": "scientific_concepts.txt", "size": "2.4KB", "processed": True}
+    ],
+    "total_documents": 3
+}
+
+_DELETE_TEMPLATE = {
+    "status": "success",
+    "message": "",
+    "affected_items": 1
+}
+
+_PRUNE_RESPONSE = {
+    "status": "success",
+    "message": "Memory reset completed",
+    "items_removed": {
+        "documents": 3,
+        "entities": 25,
+        "relationships": 18,
+        "embeddings": 47
+    }
+}
+
+_CODIFY_TEMPLATE = {
+    "status": "success",
+    "message": "",
+    "analysis": {
+        "files_analyzed": 15,
+        "functions_found": 42,
+        "classes_found": 8,
+        "dependencies": ["asyncio", "pathlib", "typing"]
+    }
+}
+
+
+def _handle_cognify(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Simulate the cognify tool."""
+    resp = _COGNIFY_TEMPLATE.copy()
+    resp["message"] = f"Processed {parameters.get('data', 'unknown')} successfully"
+    return resp
+
+
+def _handle_search(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Simulate the search tool."""
+    query = parameters.get("query", "")
+    search_type = parameters.get("search_type", "combined")
+    
+    # Simulate search results
+    mock_results = [
+        {
+            "id": "doc_1",
+            "content": f"Mock result for '{query}' - Content about {query} with relevant information.",
+            "relevance_score": 0.85,
+            "source": "document_1.txt"
+        },
+        {
+            "id": "entity_1", 
+            "type": "entity",
+            "name": query.split()[0] if query else "Entity",
+            "relationships": ["relates_to", "is_part_of"],
+            "relevance_score": 0.78
+        }
+    ]
+    
+    return {
+        "status": "success",
+        "query": query,
+        "search_type": search_type,
+        "results": mock_results[:parameters.get("limit", 5)],
+        "total_found": len(mock_results)
+    }
+
+
+def _handle_list_data(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Simulate the list_data tool."""
+    return _LIST_DATA_RESPONSE.copy()
+
+
+def _handle_delete(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Simulate the delete tool."""
+    resp = _DELETE_TEMPLATE.copy()
+    resp["message"] = f"Deleted {parameters.get('data_id', 'unknown')} successfully"
+    return resp
+
+
+def _handle_prune(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Simulate the prune tool."""
+    return _PRUNE_RESPONSE.copy()
+
+
+def _handle_codify(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Simulate the codify tool."""
+    resp = _CODIFY_TEMPLATE.copy()
+    resp["message"] = f"Code analysis completed for {parameters.get('repository', 'unknown')}"
+    return resp
+
+
+# Simulated Cognee MCP server tools, keyed by tool name
+_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "cognify": _handle_cognify,
+    "search": _handle_search,
+    "list_data": _handle_list_data,
+    "delete": _handle_delete,
+    "prune": _handle_prune,
+    "codify": _handle_codify,
+}
+
 
 class MCPSimulator:
     """Simulate MCP interactions for testing."""
     
-    def __init__(self):
+    def __init__(self, out: Optional[TextIO] = None):
         self.server_process = None
-        self.temp_files = []
+        self.out = out  # where tool-call traces are printed; stdout by default
+        # Holds generated files; removed in one rmtree by cleanup()
+        self._tmpdir = tempfile.TemporaryDirectory(prefix="mcp_sim_")
+        # Simulated tools are pure functions of their parameters, so responses are memoized
+        self._cache: Dict[Any, Dict[str, Any]] = {}
+        self._cache_stats = {"hits": 0, "misses": 0}
     
     def create_mcp_settings(self) -> Path:
         """Create Claude Code MCP settings configuration."""
         
         # Find the cognee-mcp directory (assuming it's in the parent directory structure)
-        current_dir = Path(__file__).parent.parent
-        possible_paths = [
-            current_dir / "cognee" / "cognee-mcp",
-            current_dir.parent / "cognee" / "cognee-mcp",
-            Path.home() / "cognee" / "cognee-mcp",
-        ]
-        
-        cognee_mcp_path = None
-        for path in possible_paths:
-            if path.exists():
-                cognee_mcp_path = path
-                break
+        cognee_mcp_path = _cognee_mcp_path()
         
         if not cognee_mcp_path:
-            print("⚠️  Cognee MCP server not found. Please clone and setup:")
-            print("   git clone https://github.com/topoteretes/cognee.git")
-            print("   cd cognee/cognee-mcp && uv sync")
+            print("⚠️  Cognee MCP server not found. Please clone and setup:", file=self.out)
+            print("   git clone https://github.com/topoteretes/cognee.git", file=self.out)
+            print("   cd cognee/cognee-mcp && uv sync", file=self.out)
             return None
         
         settings = {
@@ -67,153 +237,176 @@ class MCPSimulator:
         }
         
         # Create temporary settings file
-        settings_file = Path(tempfile.mktemp(suffix="_mcp_settings.json"))
-        settings_file.write_text(json.dumps(settings, indent=2))
-        self.temp_files.append(settings_file)
+        settings_file = Path(self._tmpdir.name) / "mcp_settings.json"
+        settings_file.write_bytes(_dumps_bytes(settings))
         
         return settings_file
     
     def simulate_mcp_tool_call(self, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
-        """Simulate an MCP tool call."""
+        """Simulate an MCP tool call, answering repeated identical calls from the cache."""
+        try:
+            key = (tool_name, _freeze(parameters))
+            cached = self._cache.get(key)
+        except TypeError:  # unhashable parameter values: skip the cache
+            key, cached = None, None
         
-        print(f"🔧 Simulating MCP tool call: {tool_name}")
-        print(f"   Parameters: {json.dumps(parameters, indent=2)}")
+        if cached is not None:
+            self._cache_stats["hits"] += 1
+            print(f"🔧 MCP tool call (cached): {tool_name}", file=self.out)
+            return cached.copy()
         
-        # Simulate different tool responses based on Cognee MCP server
-        if tool_name == "cognify":
-            return {
-                "status": "success",
-                "message": f"Processed {parameters.get('data', 'unknown')} successfully",
-                "entities_extracted": 25,
-                "relationships_found": 18,
-                "processing_time": "2.3s"
-            }
+        self._cache_stats["misses"] += 1
+        print(f"🔧 Simulating MCP tool call: {tool_name}", file=self.out)
+        print(f"   Parameters: {_dumps(parameters)}", file=self.out)
         
-        elif tool_name == "search":
-            query = parameters.get("query", "")
-            search_type = parameters.get("search_type", "combined")
-            
-            # Simulate search results
-            mock_results = [
-                {
-                    "id": "doc_1",
-                    "content": f"Mock result for '{query}' - Content about {query} with relevant information.",
-                    "relevance_score": 0.85,
-                    "source": "document_1.txt"
-                },
-                {
-                    "id": "entity_1", 
-                    "type": "entity",
-                    "name": query.split()[0] if query else "Entity",
-                    "relationships": ["relates_to", "is_part_of"],
-                    "relevance_score": 0.78
-                }
-            ]
-            
-            return {
-                "status": "success",
-                "query": query,
-                "search_type": search_type,
-                "results": mock_results[:parameters.get("limit", 5)],
-                "total_found": len(mock_results)
-            }
-        
-        elif tool_name == "list_data":
-            return {
-                "status": "success",
-                "datasets": [
-                    {"name": "ai_research.txt", "size": "2.1KB", "processed": True},
-                    {"name": "tech_companies.txt", "size": "1.8KB", "processed": True},
-                    {"name": "scientific_concepts.txt", "size": "2.4KB", "processed": True}
-                ],
-                "total_documents": 3
-            }
-        
-        elif tool_name == "delete":
-            return {
-                "status": "success",
-                "message": f"Deleted {parameters.get('data_id', 'unknown')} successfully",
-                "affected_items": 1
-            }
-        
-        elif tool_name == "prune":
-            return {
-                "status": "success", 
-                "message": "Memory reset completed",
-                "items_removed": {
-                    "documents": 3,
-                    "entities": 25,
-                    "relationships": 18,
-                    "embeddings": 47
-                }
-            }
-        
-        elif tool_name == "codify":
-            return {
-                "status": "success",
-                "message": f"Code analysis completed for {parameters.get('repository', 'unknown')}",
-                "analysis": {
-                    "files_analyzed": 15,
-                    "functions_found": 42,
-                    "classes_found": 8,
-                    "dependencies": ["asyncio", "pathlib", "typing"]
-                }
-            }
-        
-        else:
+        result = self._simulate(tool_name, parameters)
+        if key is not None and result.get("status") == "success":
+            self._cache[key] = result
+            return result.copy()
+        return result
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return tool-call cache hits, misses and hit rate."""
+        total = self._cache_stats["hits"] + self._cache_stats["misses"]
+        return {
+            **self._cache_stats,
+            "hit_rate": self._cache_stats["hits"] / total if total else 0.0
+        }
+    
+    def _simulate(self, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the simulated response for a tool call."""
+        handler = _HANDLERS.get(tool_name)
+        if handler is None:
             return {
                 "status": "error",
                 "message": f"Unknown tool: {tool_name}"
             }
+        return handler(parameters)
     
     def cleanup(self):
         """Clean up temporary files."""
-        for temp_file in self.temp_files:
-            try:
-                temp_file.unlink()
-            except:
-                pass
+        self._tmpdir.cleanup()
+    
+    def __enter__(self) -> "MCPSimulator":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.cleanup()
+
+
+# Demo content, shared by every demonstrate_mcp_integration() call.
+# Integration examples are (scenario, claude_prompt, mcp_tools, expected_flow).
+_INTEGRATION_EXAMPLES: Tuple[Tuple[str, str, Tuple[str, ...], Tuple[str, ...]], ...] = (
+    (
+        "Document Analysis Workflow",
+        "Analyze the documents in my project and extract key entities",
+        ("list_data", "cognify", "search"),
+        (
+            "Claude lists available data",
+            "Claude processes documents with cognify",
+            "Claude searches for extracted entities"
+        )
+    ),
+    (
+        "Research Question Answering",
+        "What do you know about machine learning researchers?",
+        ("search",),
+        (
+            "Claude searches with vector similarity",
+            "Claude searches graph relationships", 
+            "Claude combines results for comprehensive answer"
+        )
+    ),
+    (
+        "Code Repository Analysis",
+        "Analyze my codebase and find related concepts",
+        ("codify", "search"),
+        (
+            "Claude analyzes code structure",
+            "Claude searches for related documentation",
+            "Claude provides integrated analysis"
+        )
+    )
+)
+
+_BEST_PRACTICES: Tuple[str, ...] = (
+    "✅ Use environment variables for API keys and sensitive config",
+    "✅ Implement proper error handling in MCP tool responses", 
+    "✅ Provide clear tool descriptions for Claude to understand capabilities",
+    "✅ Use structured outputs for better Claude integration",
+    "✅ Implement timeout handling for long-running operations",
+    "✅ Log MCP interactions for debugging and monitoring",
+    "✅ Test MCP tools independently before Claude integration",
+    "✅ Use resource URIs for consistent data access patterns"
+)
+
+_TROUBLESHOOTING: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("Connection Issues", (
+        "Check if Cognee MCP server is running",
+        "Verify environment variables are set correctly",
+        "Ensure network connectivity to databases"
+    )),
+    ("Performance Issues", (
+        "Monitor database query execution times",
+        "Optimize vector search parameters",
+        "Use connection pooling for database access"
+    )),
+    ("Data Issues", (
+        "Verify documents are properly processed",
+        "Check entity extraction quality",
+        "Validate relationship mappings"
+    ))
+)
 
 
 async def demonstrate_mcp_integration():
     """Demonstrate MCP integration patterns."""
+    # Output is buffered and written to stdout once per numbered section
+    out = io.StringIO()
     
-    print("🔌 MCP Integration Demonstration")
-    print("=" * 40)
+    def flush():
+        sys.stdout.write(out.getvalue())
+        out.seek(0)
+        out.truncate()
     
-    simulator = MCPSimulator()
+    print("🔌 MCP Integration Demonstration", file=out)
+    print("=" * 40, file=out)
     
-    try:
+    # Buffered output is flushed even if a step fails or returns early
+    with MCPSimulator(out=out) as simulator, contextlib.ExitStack() as stack:
+        stack.callback(flush)
+        
         # Step 1: Create MCP configuration
-        print("\n1️⃣  Creating MCP Configuration")
+        print("\n1️⃣  Creating MCP Configuration", file=out)
         settings_file = simulator.create_mcp_settings()
         
         if settings_file:
-            print(f"✅ Created MCP settings at: {settings_file}")
-            print("💡 Add this configuration to your Claude Code settings.json")
+            print(f"✅ Created MCP settings at: {settings_file}", file=out)
+            print("💡 Add this configuration to your Claude Code settings.json", file=out)
             
             # Show the configuration
             settings_content = settings_file.read_text()
-            print("\n📄 MCP Configuration:")
-            print(settings_content)
+            print("\n📄 MCP Configuration:", file=out)
+            print(settings_content, file=out)
         else:
-            print("⚠️  Could not create MCP configuration")
+            print("⚠️  Could not create MCP configuration", file=out)
             return
+        flush()
         
         # Step 2: Simulate MCP tool interactions
-        print("\n2️⃣  Simulating MCP Tool Interactions")
+        print("\n2️⃣  Simulating MCP Tool Interactions", file=out)
         
         # Test cognify tool
-        print("\n🧠 Testing 'cognify' tool (document processing):")
+        print("\n🧠 Testing 'cognify' tool (document processing):", file=out)
         cognify_result = simulator.simulate_mcp_tool_call("cognify", {
             "data": "./examples/sample_documents/",
             "extract_entities": True,
             "build_graph": True
         })
-        print(f"   Result: {json.dumps(cognify_result, indent=2)}")
+        print(f"   Result: {_dumps(cognify_result)}", file=out)
         
         # Test search tool
-        print("\n🔍 Testing 'search' tool:")
+        print("\n🔍 Testing 'search' tool:", file=out)
         search_queries = [
             {"query": "machine learning", "search_type": "vector", "limit": 3},
             {"query": "technology companies", "search_type": "graph", "limit": 3},
@@ -222,124 +415,65 @@ async def demonstrate_mcp_integration():
         
         for query_params in search_queries:
             search_result = simulator.simulate_mcp_tool_call("search", query_params)
-            print(f"   Query: '{query_params['query']}' ({query_params['search_type']})")
-            print(f"   Found: {search_result.get('total_found', 0)} results")
+            print(f"   Query: '{query_params['query']}' ({query_params['search_type']})", file=out)
+            print(f"   Found: {search_result.get('total_found', 0)} results", file=out)
         
         # Test list_data tool
-        print("\n📋 Testing 'list_data' tool:")
+        print("\n📋 Testing 'list_data' tool:", file=out)
         list_result = simulator.simulate_mcp_tool_call("list_data", {})
-        print(f"   Datasets: {list_result.get('total_documents', 0)} documents")
+        print(f"   Datasets: {list_result.get('total_documents', 0)} documents", file=out)
         for dataset in list_result.get('datasets', []):
-            print(f"     - {dataset['name']} ({dataset['size']})")
+            print(f"     - {dataset['name']} ({dataset['size']})", file=out)
         
         # Test codify tool
-        print("\n📝 Testing 'codify' tool (code analysis):")
+        print("\n📝 Testing 'codify' tool (code analysis):", file=out)
         codify_result = simulator.simulate_mcp_tool_call("codify", {
             "repository": "./src/",
             "analyze_dependencies": True
         })
         analysis = codify_result.get('analysis', {})
-        print(f"   Files analyzed: {analysis.get('files_analyzed', 0)}")
-        print(f"   Functions found: {analysis.get('functions_found', 0)}")
-        print(f"   Dependencies: {', '.join(analysis.get('dependencies', []))}")
+        print(f"   Files analyzed: {analysis.get('files_analyzed', 0)}", file=out)
+        print(f"   Functions found: {analysis.get('functions_found', 0)}", file=out)
+        print(f"   Dependencies: {', '.join(analysis.get('dependencies', []))}", file=out)
         
-        # Step 3: Demonstrate Claude Code integration patterns
-        print("\n3️⃣  Claude Code Integration Patterns")
+        stats = simulator.cache_stats()
+        print(f"\n📦 Tool-call cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%} hit rate)", file=out)
+        flush()
         
-        integration_examples = [
-            {
-                "scenario": "Document Analysis Workflow",
-                "claude_prompt": "Analyze the documents in my project and extract key entities",
-                "mcp_tools": ["list_data", "cognify", "search"],
-                "expected_flow": [
-                    "Claude lists available data",
-                    "Claude processes documents with cognify",
-                    "Claude searches for extracted entities"
-                ]
-            },
-            {
-                "scenario": "Research Question Answering",
-                "claude_prompt": "What do you know about machine learning researchers?",
-                "mcp_tools": ["search"],
-                "expected_flow": [
-                    "Claude searches with vector similarity",
-                    "Claude searches graph relationships", 
-                    "Claude combines results for comprehensive answer"
-                ]
-            },
-            {
-                "scenario": "Code Repository Analysis",
-                "claude_prompt": "Analyze my codebase and find related concepts",
-                "mcp_tools": ["codify", "search"],
-                "expected_flow": [
-                    "Claude analyzes code structure",
-                    "Claude searches for related documentation",
-                    "Claude provides integrated analysis"
-                ]
-            }
-        ]
+        # Step 3: Demonstrate Claude Code integration patterns
+        print("\n3️⃣  Claude Code Integration Patterns", file=out)
         
-        for example in integration_examples:
-            print(f"\n🎯 Scenario: {example['scenario']}")
-            print(f"   User: \"{example['claude_prompt']}\"")
-            print(f"   Tools: {', '.join(example['mcp_tools'])}")
-            print("   Expected Flow:")
-            for i, step in enumerate(example['expected_flow'], 1):
-                print(f"     {i}. {step}")
+        for scenario, claude_prompt, mcp_tools, expected_flow in _INTEGRATION_EXAMPLES:
+            print(f"\n🎯 Scenario: {scenario}", file=out)
+            print(f"   User: \"{claude_prompt}\"", file=out)
+            print(f"   Tools: {', '.join(mcp_tools)}", file=out)
+            print("   Expected Flow:", file=out)
+            for i, step in enumerate(expected_flow, 1):
+                print(f"     {i}. {step}", file=out)
+        flush()
         
         # Step 4: Best practices
-        print("\n4️⃣  MCP Integration Best Practices")
-        
-        best_practices = [
-            "✅ Use environment variables for API keys and sensitive config",
-            "✅ Implement proper error handling in MCP tool responses", 
-            "✅ Provide clear tool descriptions for Claude to understand capabilities",
-            "✅ Use structured outputs for better Claude integration",
-            "✅ Implement timeout handling for long-running operations",
-            "✅ Log MCP interactions for debugging and monitoring",
-            "✅ Test MCP tools independently before Claude integration",
-            "✅ Use resource URIs for consistent data access patterns"
-        ]
+        print("\n4️⃣  MCP Integration Best Practices", file=out)
         
-        for practice in best_practices:
-            print(f"   {practice}")
+        for practice in _BEST_PRACTICES:
+            print(f"   {practice}", file=out)
+        flush()
         
         # Step 5: Troubleshooting guide
-        print("\n5️⃣  Common Issues & Solutions")
+        print("\n5️⃣  Common Issues & Solutions", file=out)
         
-        troubleshooting = {
-            "Connection Issues": [
-                "Check if Cognee MCP server is running",
-                "Verify environment variables are set correctly",
-                "Ensure network connectivity to databases"
-            ],
-            "Performance Issues": [
-                "Monitor database query execution times",
-                "Optimize vector search parameters",
-                "Use connection pooling for database access"
-            ],
-            "Data Issues": [
-                "Verify documents are properly processed",
-                "Check entity extraction quality",
-                "Validate relationship mappings"
-            ]
-        }
-        
-        for issue_type, solutions in troubleshooting.items():
-            print(f"\n   🚨 {issue_type}:")
+        for issue_type, solutions in _TROUBLESHOOTING:
+            print(f"\n   🚨 {issue_type}:", file=out)
             for solution in solutions:
-                print(f"     - {solution}")
-    
-    finally:
-        # Cleanup
-        simulator.cleanup()
+                print(f"     - {solution}", file=out)
     
-    print("\n✅ MCP integration demonstration completed!")
-    print("\nNext Steps:")
-    print("1. Clone and setup Cognee MCP server")
-    print("2. Add MCP configuration to Claude Code settings")
-    print("3. Test integration with real Claude Code session")
-    print("4. Monitor performance and optimize as needed")
+    print("\n✅ MCP integration demonstration completed!", file=out)
+    print("\nNext Steps:", file=out)
+    print("1. Clone and setup Cognee MCP server", file=out)
+    print("2. Add MCP configuration to Claude Code settings", file=out)
+    print("3. Test integration with real Claude Code session", file=out)
+    print("4. Monitor performance and optimize as needed", file=out)
+    flush()
 
 
 async def main():
@@ -348,4 +482,16 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:  # optional: pip install cognee-graphrag[fast]
+        uvloop = None
+    
+    if uvloop is None:
+        asyncio.run(main())
+    elif sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main())
+    else:
+        uvloop.install()
+        asyncio.run(main())
\ No newline at end of file
@@ -1,16 +1,59 @@
 """Main GraphRAG implementation using Cognee with multi-database architecture."""
 
 import asyncio
-from typing import Dict, List, Any, Optional, Union
+import contextlib
+import sys
+import threading
+import time
+from itertools import chain, islice
+from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass
 from pathlib import Path
 import cognee
-from config import setup_all_databases, test_all_connections
+from config import setup_all_databases, test_all_connections_async
 
 
-@dataclass
+# dataclass(slots=...) needs Python 3.10; 3.9 falls back to a regular __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Seconds get_statistics serves a cached result before querying the databases again
+STATS_TTL = 5.0
+
+# Seconds a successful connection test lets initialize() skip probing again
+CONNECTION_CHECK_TTL = 60.0
+
+# Node and relationship counts in one round trip; OPTIONAL MATCH keeps a
+# row (with 0 relationships) on graphs that have nodes but no edges
+_NEO4J_COUNTS_QUERY = (
+    "MATCH (n) WITH COUNT(n) AS node_count "
+    "OPTIONAL MATCH ()-[r]->() RETURN node_count, COUNT(r) AS rel_count"
+)
+
+# Whether cognee.search accepts top_k; None until the first search finds out
+_search_accepts_top_k: Optional[bool] = None
+
+
+async def _cognee_search(query: str, search_type: str, top_k: int) -> List[Any]:
+    """Call cognee.search, pushing top_k down to the engine when supported."""
+    global _search_accepts_top_k
+    
+    if _search_accepts_top_k is not False:
+        try:
+            results = await cognee.search(query, search_type=search_type, top_k=top_k)
+            _search_accepts_top_k = True
+            return results
+        except TypeError as e:
+            if "top_k" not in str(e):
+                raise
+            _search_accepts_top_k = False
+            print("ℹ️  cognee.search does not accept top_k; limiting results client-side")
+    
+    return await cognee.search(query, search_type=search_type)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class GraphRAGConfig:
-    """Configuration for GraphRAG system."""
+    """Configuration for GraphRAG system (immutable and hashable)."""
     
     # Processing settings
     chunk_size: int = 1000
@@ -37,6 +80,12 @@ class GraphRAG:
     def __init__(self, config: Optional[GraphRAGConfig] = None):
         self.config = config or GraphRAGConfig()
         self.databases = None
+        self._neo4j_session = None
+        # Cleanup callbacks for everything opened since initialize, run LIFO by close()
+        self._stack = contextlib.AsyncExitStack()
+        self._neo4j_lock = threading.Lock()
+        self._stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._connections_checked_at: Optional[float] = None
         self._initialized = False
     
     async def initialize(self) -> bool:
@@ -50,12 +99,21 @@ class GraphRAG:
             # Setup all database configurations
             self.databases = setup_all_databases()
             
-            # Test all connections
-            connection_results = test_all_connections()
+            # Register cleanups before testing, so a failed init still closes them
+            for db in self.databases.values():
+                if callable(getattr(db, "close", None)):
+                    self._stack.callback(db.close)
             
-            if not all(connection_results.values()):
-                print("⚠️  Some database connections failed")
-                return False
+            # Test all connections, unless they passed recently
+            now = time.monotonic()
+            checked_at = self._connections_checked_at
+            if checked_at is None or now - checked_at >= CONNECTION_CHECK_TTL:
+                connection_results = await test_all_connections_async(self.databases)
+                
+                if not all(connection_results.values()):
+                    print("⚠️  Some database connections failed")
+                    return False
+                self._connections_checked_at = now
             
             # Configure Cognee with our settings
             await self._configure_cognee()
@@ -71,8 +129,9 @@ class GraphRAG:
     async def _configure_cognee(self) -> None:
         """Configure Cognee with processing parameters."""
         # Set chunk size and overlap
-        cognee.config.set_chunk_size(self.config.chunk_size)
-        cognee.config.set_chunk_overlap(self.config.chunk_overlap)
+        cfg = self.config
+        cognee.config.set_chunk_size(cfg.chunk_size)
+        cognee.config.set_chunk_overlap(cfg.chunk_overlap)
         
         # Additional configuration as needed
         print("🔧 Cognee configuration applied")
@@ -92,12 +151,35 @@ class GraphRAG:
             if isinstance(documents, (str, Path)):
                 documents = [documents]
             
-            # Add documents to Cognee
-            for doc in documents:
-                await cognee.add(str(doc))
+            # Add documents to Cognee concurrently, bounded by max_concurrent_documents
+            sem = asyncio.Semaphore(self.config.max_concurrent_documents)
+            
+            async def _add_one(doc):
+                async with sem:
+                    await cognee.add(str(doc))
                 print(f"✅ Added: {doc}")
             
-            return {"status": "success", "documents_added": len(documents)}
+            results = await asyncio.gather(
+                *(_add_one(doc) for doc in documents), return_exceptions=True
+            )
+            
+            failed = [
+                {"document": str(doc), "error": str(result)}
+                for doc, result in zip(documents, results)
+                if isinstance(result, Exception)
+            ]
+            added = len(documents) - len(failed)
+            
+            if failed:
+                print(f"❌ Failed to add {len(failed)} of {len(documents)} documents")
+                return {
+                    "status": "error",
+                    "error": f"{len(failed)} document(s) failed to add",
+                    "documents_added": added,
+                    "failed": failed
+                }
+            
+            return {"status": "success", "documents_added": added}
             
         except Exception as e:
             print(f"❌ Error adding documents: {e}")
@@ -120,6 +202,10 @@ class GraphRAG:
         except Exception as e:
             print(f"❌ Error processing documents: {e}")
             return {"status": "error", "error": str(e)}
+        
+        finally:
+            # The graph and vector stores changed (possibly partially)
+            self._stats_cache = None
     
     async def search(
         self, 
@@ -155,13 +241,13 @@ class GraphRAG:
     async def _vector_search(self, query: str, top_k: int) -> Dict[str, Any]:
         """Perform vector similarity search."""
         try:
-            results = await cognee.search(query, search_type="vector")
+            results = await _cognee_search(query, "vector", top_k)
             
             return {
                 "status": "success",
                 "search_type": "vector",
                 "query": query,
-                "results": results[:top_k] if results else []
+                "results": list(islice(results, top_k)) if results else []
             }
         except Exception as e:
             return {"status": "error", "error": f"Vector search failed: {e}"}
@@ -169,13 +255,13 @@ class GraphRAG:
     async def _graph_search(self, query: str, top_k: int) -> Dict[str, Any]:
         """Perform graph-based search."""
         try:
-            results = await cognee.search(query, search_type="graph")
+            results = await _cognee_search(query, "graph", top_k)
             
             return {
                 "status": "success",
                 "search_type": "graph", 
                 "query": query,
-                "results": results[:top_k] if results else []
+                "results": list(islice(results, top_k)) if results else []
             }
         except Exception as e:
             return {"status": "error", "error": f"Graph search failed: {e}"}
@@ -183,41 +269,42 @@ class GraphRAG:
     async def _combined_search(self, query: str, top_k: int) -> Dict[str, Any]:
         """Perform combined vector and graph search."""
         try:
-            # Get results from both search types
-            vector_task = self._vector_search(query, top_k // 2)
-            graph_task = self._graph_search(query, top_k // 2)
+            # Get results from both search types, each asked for half of top_k
+            half = top_k // 2
+            vector_task = self._vector_search(query, half)
+            graph_task = self._graph_search(query, half)
             
             vector_results, graph_results = await asyncio.gather(
                 vector_task, graph_task, return_exceptions=True
             )
             
-            # Combine results
-            combined_results = []
-            
-            if isinstance(vector_results, dict) and vector_results.get("results"):
-                combined_results.extend(vector_results["results"])
+            # Inspect each outcome once; a raised exception counts as no results
+            v = (vector_results.get("results") or []) if isinstance(vector_results, dict) else []
+            g = (graph_results.get("results") or []) if isinstance(graph_results, dict) else []
             
-            if isinstance(graph_results, dict) and graph_results.get("results"):
-                combined_results.extend(graph_results["results"])
+            # Stream both result lists without concatenating them
+            stream = chain(v, g)
             
-            # Remove duplicates and limit results
-            seen = set()
-            unique_results = []
-            for result in combined_results:
-                result_id = result.get("id", str(result))
+            # Remove duplicates and limit results; str(result) is only the
+            # fallback key for results without an id
+            seen = {}
+            for result in stream:
+                result_id = result.get("id")
+                if result_id is None:
+                    result_id = str(result)
                 if result_id not in seen:
-                    seen.add(result_id)
-                    unique_results.append(result)
-                    if len(unique_results) >= top_k:
+                    seen[result_id] = result
+                    if len(seen) >= top_k:
                         break
+            unique_results = list(seen.values())
             
             return {
                 "status": "success",
                 "search_type": "combined",
                 "query": query,
                 "results": unique_results,
-                "vector_count": len(vector_results.get("results", [])) if isinstance(vector_results, dict) else 0,
-                "graph_count": len(graph_results.get("results", [])) if isinstance(graph_results, dict) else 0
+                "vector_count": len(v),
+                "graph_count": len(g)
             }
             
         except Exception as e:
@@ -228,52 +315,88 @@ class GraphRAG:
         if not self._initialized:
             await self.initialize()
         
+        now = time.monotonic()
+        if self._stats_cache and now - self._stats_cache[0] < STATS_TTL:
+            return self._stats_cache[1]
+        
         stats = {"databases": {}}
         
-        try:
-            # SQLite stats
-            if self.databases and "sqlite" in self.databases:
-                sqlite_config = self.databases["sqlite"]
-                stats["databases"]["sqlite"] = sqlite_config.get_stats()
-            
-            # Neo4j stats
-            if self.databases and "neo4j" in self.databases:
-                neo4j_config = self.databases["neo4j"]
-                with neo4j_config.driver.session(database=neo4j_config.database) as session:
-                    result = session.run("MATCH (n) RETURN COUNT(n) as node_count")
-                    node_count = result.single()["node_count"]
-                    
-                    result = session.run("MATCH ()-[r]->() RETURN COUNT(r) as rel_count")
-                    rel_count = result.single()["rel_count"]
-                    
-                    stats["databases"]["neo4j"] = {
-                        "nodes": node_count,
-                        "relationships": rel_count
-                    }
-            
-            # LanceDB stats
-            if self.databases and "lancedb" in self.databases:
-                lancedb_config = self.databases["lancedb"]
-                tables = lancedb_config.list_tables()
-                table_info = {}
-                for table_name in tables:
-                    info = lancedb_config.get_table_info(table_name)
-                    if "count" in info:
-                        table_info[table_name] = info["count"]
-                
-                stats["databases"]["lancedb"] = {
-                    "tables": len(tables),
-                    "table_rows": table_info
-                }
-            
-            stats["status"] = "success"
-            
-        except Exception as e:
+        # Each probe is blocking I/O; run them side by side off the event loop
+        probes = {
+            name: probe
+            for name, probe in (
+                ("sqlite", self._sqlite_stats),
+                ("neo4j", self._neo4j_stats),
+                ("lancedb", self._lancedb_stats),
+            )
+            if self.databases and name in self.databases
+        }
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(None, probe) for probe in probes.values()),
+            return_exceptions=True
+        )
+        
+        errors = []
+        for name, result in zip(probes, results):
+            if isinstance(result, Exception):
+                errors.append(f"{name}: {result}")
+            else:
+                stats["databases"][name] = result
+        
+        if errors:
             stats["status"] = "error"
-            stats["error"] = str(e)
+            stats["error"] = "; ".join(errors)
+        else:
+            stats["status"] = "success"
+            self._stats_cache = (now, stats)
         
         return stats
     
+    def _sqlite_stats(self) -> Dict[str, Any]:
+        """Get SQLite statistics (blocking)."""
+        return self.databases["sqlite"].get_stats()
+    
+    def _neo4j_stats(self) -> Dict[str, Any]:
+        """Get Neo4j node and relationship counts (blocking)."""
+        # The session is shared, so overlapping calls must not use it at once
+        with self._neo4j_lock:
+            record = self._get_neo4j_session().run(_NEO4J_COUNTS_QUERY).single()
+        return {
+            "nodes": record["node_count"],
+            "relationships": record["rel_count"]
+        }
+    
+    def _lancedb_stats(self) -> Dict[str, Any]:
+        """Get LanceDB table and row counts (blocking)."""
+        lancedb_config = self.databases["lancedb"]
+        tables = lancedb_config.list_tables()
+        table_info = {}
+        for table_name in tables:
+            info = lancedb_config.get_table_info(table_name)
+            if "count" in info:
+                table_info[table_name] = info["count"]
+        
+        return {
+            "tables": len(tables),
+            "table_rows": table_info
+        }
+    
+    def _get_neo4j_session(self):
+        """Get the Neo4j session reused for statistics, opening it on first use."""
+        if self._neo4j_session is None:
+            neo4j_config = self.databases["neo4j"]
+            self._neo4j_session = neo4j_config.driver.session(database=neo4j_config.database)
+            # Registered after the driver, so it is closed before the driver
+            self._stack.callback(self._close_neo4j_session)
+        return self._neo4j_session
+    
+    def _close_neo4j_session(self) -> None:
+        """Close the statistics Neo4j session."""
+        if self._neo4j_session is not None:
+            self._neo4j_session.close()
+            self._neo4j_session = None
+    
     async def reset(self) -> Dict[str, Any]:
         """Reset all databases and clear data."""
         if not self._initialized:
@@ -288,6 +411,7 @@ class GraphRAG:
             # Also clear our database configurations
             from config import clear_all_databases
             clear_all_databases()
+            self._stats_cache = None
             
             print("✅ GraphRAG system reset completed")
             return {"status": "success", "message": "System reset successfully"}
@@ -300,12 +424,12 @@ class GraphRAG:
         """Close all database connections."""
         if self.databases:
             try:
-                if "neo4j" in self.databases:
-                    self.databases["neo4j"].close()
+                await self._stack.aclose()
                 print("✅ Database connections closed")
             except Exception as e:
                 print(f"⚠️  Error closing connections: {e}")
         
+        self._stack = contextlib.AsyncExitStack()
         self._initialized = False
 
 